@@ -4,20 +4,31 @@ API server for LogFlow.
 import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 from typing import Dict, List, Any, Optional
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 
 from logflow.core.engine import Engine
-from logflow.core.config import load_config_file, validate_pipeline_config, ConfigError
+from logflow.core.config import load_config_file, validate_pipeline_config, ConfigError, SafeDumper
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Log startup and stop the engine on shutdown."""
+    logger.info("Starting LogFlow API server")
+    yield
+    logger.info("Stopping LogFlow API server")
+    await engine.stop()
 
 
 # Create the FastAPI app
 app = FastAPI(
     title="LogFlow API",
     description="API for managing LogFlow pipelines",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Create the engine
@@ -51,19 +62,6 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the engine on startup."""
-    logger.info("Starting LogFlow API server")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Stop the engine on shutdown."""
-    logger.info("Stopping LogFlow API server")
-    await engine.stop()
-
-
 @app.get("/api/v1/pipelines", response_model=List[str])
 async def list_pipelines():
     """List all pipelines."""
@@ -101,7 +99,7 @@ async def create_pipeline(pipeline: PipelineConfig, background_tasks: Background
         
         with open(config_path, "w") as f:
             import yaml
-            yaml.dump(pipeline.config, f)
+            yaml.dump(pipeline.config, f, Dumper=SafeDumper)
         
         # Load and start the pipeline
         pipeline = await engine.load_pipeline(config_path)
@@ -182,13 +180,14 @@ async def stop_pipeline(name: str):
 @app.get("/api/v1/metrics")
 async def get_metrics():
     """Get system metrics."""
+    pipeline_names = engine.get_pipeline_names()
     metrics = {
-        "pipelines": len(engine.get_pipeline_names()),
+        "pipelines": len(pipeline_names),
         "pipeline_metrics": {}
     }
     
     # Add metrics for each pipeline
-    for name in engine.get_pipeline_names():
+    for name in pipeline_names:
         try:
             status = engine.get_pipeline_status(name)
             metrics["pipeline_metrics"][name] = {
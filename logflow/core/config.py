@@ -5,6 +5,12 @@ import os
 from typing import Any, Dict, List, Optional, Union
 import yaml
 
+# Use the libyaml-backed loader and dumper when available
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on libyaml
+    from yaml import SafeDumper, SafeLoader
+
 
 class ConfigError(Exception):
     """Exception raised for configuration errors."""
@@ -29,7 +35,7 @@ def load_config_file(path: str) -> Dict[str, Any]:
     
     try:
         with open(path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
             
         if not isinstance(config, dict):
             raise ConfigError(f"Invalid configuration format in {path}")
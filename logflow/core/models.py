@@ -1,21 +1,89 @@
 """
 Core data models for LogFlow.
 """
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+import time
 import uuid
 
 
+# Naive UTC epoch used for timestamp conversions
+EPOCH = datetime(1970, 1, 1)
+
+# Last formatted second, shared by consecutive events in the same second
+_last_iso_second: Tuple[int, str] = (-1, "")
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """
+    Convert a datetime to nanoseconds since the epoch.
+    
+    Naive datetimes are assumed to be in UTC.
+    
+    Args:
+        value: Datetime to convert
+        
+    Returns:
+        Nanoseconds since the epoch
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
+def ns_to_datetime(timestamp_ns: int) -> datetime:
+    """
+    Convert nanoseconds since the epoch to a naive UTC datetime.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch
+        
+    Returns:
+        Naive UTC datetime
+    """
+    return EPOCH + timedelta(microseconds=timestamp_ns // 1000)
+
+
+def fast_isoformat(timestamp_ns: int) -> str:
+    """
+    Format nanoseconds since the epoch like ``datetime.isoformat()`` would.
+    
+    The date and time part is cached for the last formatted second, so
+    consecutive events in the same second only format their fraction.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch
+        
+    Returns:
+        ISO 8601 string of the naive UTC time
+    """
+    global _last_iso_second
+    
+    seconds, remainder = divmod(timestamp_ns, 1_000_000_000)
+    cached_seconds, prefix = _last_iso_second
+    if cached_seconds != seconds:
+        prefix = (EPOCH + timedelta(seconds=seconds)).isoformat()
+        _last_iso_second = (seconds, prefix)
+    
+    microseconds = remainder // 1000
+    if microseconds:
+        return f"{prefix}.{microseconds:06d}"
+    return prefix
+
+
 class LogEvent:
     """
     Unified data model for representing log events during processing.
     
     Attributes:
         id: Unique identifier for the event
-        timestamp: Date and time of the event
+        timestamp_ns: Date and time of the event in nanoseconds since the epoch
+        timestamp: Date and time of the event as a datetime (built on demand)
         source_type: Type of the source (file, syslog, etc.)
         source_name: Name or identifier of the source
-        raw_data: Original raw data
+        raw_data: Original raw data (bytes when the source skips decoding)
         fields: Extracted and processed fields
         metadata: Processing metadata
         tags: Tags for categorization
@@ -23,7 +91,7 @@ class LogEvent:
     
     def __init__(
         self,
-        raw_data: str,
+        raw_data: Union[str, bytes],
         source_type: str,
         source_name: str,
         timestamp: Optional[datetime] = None,
@@ -31,6 +99,7 @@ class LogEvent:
         metadata: Optional[Dict[str, Any]] = None,
         tags: Optional[List[str]] = None,
         event_id: Optional[str] = None,
+        timestamp_ns: Optional[int] = None,
     ):
         """
         Initialize a new LogEvent.
@@ -44,9 +113,15 @@ class LogEvent:
             metadata: Processing metadata
             tags: Tags for categorization
             event_id: Unique identifier (generated if not provided)
+            timestamp_ns: Date and time of the event in nanoseconds since the epoch,
+                used instead of timestamp to avoid building a datetime
         """
         self.id = event_id or str(uuid.uuid4())
-        self.timestamp = timestamp or datetime.utcnow()
+        if timestamp is not None:
+            self.timestamp = timestamp
+        else:
+            self.timestamp_ns = timestamp_ns if timestamp_ns is not None else time.time_ns()
+            self._timestamp = None
         self.source_type = source_type
         self.source_name = source_name
         self.raw_data = raw_data
@@ -54,6 +129,46 @@ class LogEvent:
         self.metadata = metadata or {}
         self.tags = tags or []
     
+    @property
+    def timestamp(self) -> datetime:
+        """
+        Date and time of the event.
+        
+        Returns the datetime the event was created with, or a naive UTC
+        datetime built from ``timestamp_ns`` on first access.
+        """
+        if self._timestamp is None:
+            self._timestamp = ns_to_datetime(self.timestamp_ns)
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+        self.timestamp_ns = datetime_to_ns(value)
+    
+    @property
+    def raw_text(self) -> str:
+        """
+        Original raw data as a string.
+        
+        Bytes left undecoded by the source are decoded as UTF-8 on access,
+        replacing invalid sequences.
+        """
+        if isinstance(self.raw_data, (bytes, bytearray)):
+            return self.raw_data.decode("utf-8", "replace")
+        return self.raw_data
+    
+    def isoformat(self) -> str:
+        """
+        Format the event timestamp as an ISO 8601 string.
+        
+        Returns:
+            ISO 8601 timestamp
+        """
+        if self._timestamp is not None:
+            return self._timestamp.isoformat()
+        return fast_isoformat(self.timestamp_ns)
+    
     def add_field(self, key: str, value: Any) -> None:
         """
         Add or update a field in the event.
@@ -93,10 +208,10 @@ class LogEvent:
         """
         return {
             "id": self.id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.isoformat(),
             "source_type": self.source_type,
             "source_name": self.source_name,
-            "raw_data": self.raw_data,
+            "raw_data": self.raw_text,
             "fields": self.fields,
             "metadata": self.metadata,
             "tags": self.tags,
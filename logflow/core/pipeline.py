@@ -41,6 +41,9 @@ class Pipeline:
         self.running = False
         self.logger = logging.getLogger(f"logflow.pipeline.{name}")
         
+        # Tasks processing the sources while the pipeline runs
+        self._tasks: List[asyncio.Task] = []
+        
         # Metrics
         self.events_processed = 0
         self.events_dropped = 0
@@ -173,13 +176,13 @@ class Pipeline:
         
         try:
             # Create tasks for each source
-            source_tasks = [
+            self._tasks = [
                 asyncio.create_task(self._process_source(source))
                 for source in self.sources
             ]
             
             # Wait for all source tasks to complete
-            await asyncio.gather(*source_tasks)
+            await asyncio.gather(*self._tasks)
         except asyncio.CancelledError:
             self.logger.info(f"Pipeline {self.name} was cancelled")
         except Exception as e:
@@ -187,47 +190,78 @@ class Pipeline:
             self.processing_errors += 1
         finally:
             self.running = False
+            self._tasks = []
             self.logger.info(f"Pipeline {self.name} stopped")
     
     async def _process_source(self, source: Source) -> None:
         """
         Process events from a single source.
         
+        Batches read from the source are processed and handed to a writer
+        task through a bounded queue, so a slow sink applies back-pressure
+        to the source instead of letting batches pile up in memory.
+        
         Args:
             source: Source to process
         """
         batch_size = self.config.get("batch_size", 100)
         batch_timeout = self.config.get("batch_timeout", 5.0)  # seconds
+        queue_size = self.config.get("queue_size", 10)  # batches
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        writer = asyncio.create_task(self._write_batches(queue))
+        batches = source.batched(size=batch_size, interval=batch_timeout)
+        batch: List[LogEvent] = []
+        cancelled = None
         
         try:
-            batch: List[LogEvent] = []
-            last_flush_time = time.time()
-            
-            async for event in source.read():
-                if not self.running:
-                    break
-                
-                # Process the event through all processors
-                processed_event = await self._process_event(event)
-                
-                # If the event wasn't dropped, add it to the batch
-                if processed_event:
-                    batch.append(processed_event)
+            # Keep draining after the pipeline stops, until the source ends,
+            # so that batches already read from the source are not dropped
+            async for events in batches:
+                # Process the events through all processors
+                for event in events:
+                    processed_event = await self._process_event(event)
+                    
+                    # If the event wasn't dropped, add it to the batch
+                    if processed_event:
+                        batch.append(processed_event)
                 
-                # Flush the batch if it's full or if the timeout has elapsed
-                current_time = time.time()
-                if (len(batch) >= batch_size or 
-                    current_time - last_flush_time >= batch_timeout) and batch:
-                    await self._flush_batch(batch)
+                # Wait for room in the queue if the sinks are falling behind
+                if batch:
+                    await queue.put(batch)
                     batch = []
-                    last_flush_time = current_time
-            
-            # Flush any remaining events
-            if batch:
-                await self._flush_batch(batch)
+        except asyncio.CancelledError as e:
+            # Flush the events already read before giving up
+            cancelled = e
         except Exception as e:
             self.logger.error(f"Error processing source: {str(e)}", exc_info=True)
             self.processing_errors += 1
+        finally:
+            await batches.aclose()
+        
+        # Let the writer flush the batch in hand and any queued batches
+        # before returning
+        if batch:
+            await queue.put(batch)
+        await queue.put(None)
+        await writer
+        
+        if cancelled is not None:
+            raise cancelled
+    
+    async def _write_batches(self, queue: asyncio.Queue) -> None:
+        """
+        Write batches from a queue to all sinks until a None sentinel is received.
+        
+        Args:
+            queue: Queue of batches to write
+        """
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                break
+            
+            await self._flush_batch(batch)
     
     async def _process_event(self, event: LogEvent) -> Optional[LogEvent]:
         """
@@ -279,6 +313,19 @@ class Pipeline:
                 self.logger.error(f"Error writing to sink: {str(e)}", exc_info=True)
                 self.processing_errors += 1
     
+    async def _shutdown_components(self, components: List[Any]) -> None:
+        """
+        Shut down components, logging any errors.
+        
+        Args:
+            components: Components to shut down
+        """
+        for component in components:
+            try:
+                await component.shutdown()
+            except Exception as e:
+                self.logger.error(f"Error shutting down component: {str(e)}", exc_info=True)
+    
     async def stop(self) -> None:
         """
         Stop the pipeline and clean up resources.
@@ -290,13 +337,28 @@ class Pipeline:
         self.logger.info(f"Stopping pipeline: {self.name}")
         self.running = False
         
-        # Shutdown all components
-        components = self.sources + self.processors + self.sinks
-        for component in components:
+        # Signal the sources to stop reading
+        for source in self.sources:
             try:
-                await component.shutdown()
+                await source.stop()
             except Exception as e:
-                self.logger.error(f"Error shutting down component: {str(e)}", exc_info=True)
+                self.logger.error(f"Error stopping source: {str(e)}", exc_info=True)
+        
+        # Wait for the source tasks to flush the events already read before
+        # the components are shut down, cancelling any that do not finish in
+        # time; sources may still be using their clients until then
+        tasks = self._tasks
+        if tasks:
+            stop_timeout = self.config.get("stop_timeout", 5.0)  # seconds
+            _, pending = await asyncio.wait(tasks, timeout=stop_timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.logger.warning(f"Cancelled {len(pending)} source tasks of pipeline {self.name}")
+                await asyncio.wait(pending)
+        
+        # Shut down the sources, processors and sinks
+        await self._shutdown_components(self.sources + self.processors + self.sinks)
         
         # Log pipeline statistics
         runtime = time.time() - self.start_time
@@ -123,7 +123,7 @@ class EnrichProcessor(Processor):
         # Get the source field value
         source_value = None
         if self.source_field == "raw_data":
-            source_value = event.raw_data
+            source_value = event.raw_text
         else:
             source_value = event.fields.get(self.source_field)
         
@@ -2,12 +2,88 @@
 Filter processor for LogFlow.
 """
 from typing import Dict, Any, Optional, List, Callable
+import functools
 import re
 
 from logflow.core.models import LogEvent
 from logflow.processors.base import Processor
 
 
+# Pattern of field comparison conditions
+_CONDITION_PATTERN = re.compile(r"(\w+)\s*(==|!=|>|<|>=|<=|=~|!~|in|not in)\s*(.*)")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_condition(condition: str) -> Callable[[LogEvent], bool]:
+    """
+    Parse a condition string into a callable function, caching the result.
+    
+    Conditions are stateless, so processors with the same condition, such
+    as filters repeated across pipelines, share the function and any
+    compiled regex pattern.
+    
+    Args:
+        condition: Condition string
+        
+    Returns:
+        Function that evaluates the condition for a log event
+    """
+    # Check for exists/missing conditions
+    if condition.startswith("exists:"):
+        field = condition[7:].strip()
+        return lambda event: field in event.fields
+    
+    if condition.startswith("missing:"):
+        field = condition[8:].strip()
+        return lambda event: field not in event.fields
+    
+    # Parse field comparison conditions
+    match = _CONDITION_PATTERN.match(condition)
+    if not match:
+        raise ValueError(f"Invalid condition format: {condition}")
+    
+    field, op, value_str = match.groups()
+    
+    # Parse the value
+    if op in ["in", "not in"]:
+        # Parse list of values
+        if not (value_str.startswith("[") and value_str.endswith("]")):
+            raise ValueError(f"Invalid list format in condition: {condition}")
+        
+        value_list = [v.strip() for v in value_str[1:-1].split(",")]
+        
+        if op == "in":
+            return lambda event: field in event.fields and str(event.fields[field]) in value_list
+        else:  # not in
+            return lambda event: field in event.fields and str(event.fields[field]) not in value_list
+    
+    elif op in ["=~", "!~"]:
+        # Regex pattern
+        pattern = re.compile(value_str.strip('"\''))
+        
+        if op == "=~":
+            return lambda event: field in event.fields and bool(pattern.search(str(event.fields[field])))
+        else:  # !~
+            return lambda event: field in event.fields and not bool(pattern.search(str(event.fields[field])))
+    
+    else:
+        # Simple comparison
+        value = value_str.strip('"\'')
+        
+        if op == "==":
+            return lambda event: field in event.fields and str(event.fields[field]) == value
+        elif op == "!=":
+            return lambda event: field in event.fields and str(event.fields[field]) != value
+        elif op == ">":
+            return lambda event: field in event.fields and float(event.fields[field]) > float(value)
+        elif op == "<":
+            return lambda event: field in event.fields and float(event.fields[field]) < float(value)
+        elif op == ">=":
+            return lambda event: field in event.fields and float(event.fields[field]) >= float(value)
+        elif op == "<=":
+            return lambda event: field in event.fields and float(event.fields[field]) <= float(value)
+
+
 class FilterProcessor(Processor):
     """
     Processor that filters log events based on conditions.
@@ -74,60 +150,7 @@ class FilterProcessor(Processor):
         Returns:
             Function that evaluates the condition for a log event
         """
-        # Check for exists/missing conditions
-        if condition.startswith("exists:"):
-            field = condition[7:].strip()
-            return lambda event: field in event.fields
-        
-        if condition.startswith("missing:"):
-            field = condition[8:].strip()
-            return lambda event: field not in event.fields
-        
-        # Parse field comparison conditions
-        match = re.match(r"(\w+)\s*(==|!=|>|<|>=|<=|=~|!~|in|not in)\s*(.*)", condition)
-        if not match:
-            raise ValueError(f"Invalid condition format: {condition}")
-        
-        field, op, value_str = match.groups()
-        
-        # Parse the value
-        if op in ["in", "not in"]:
-            # Parse list of values
-            if not (value_str.startswith("[") and value_str.endswith("]")):
-                raise ValueError(f"Invalid list format in condition: {condition}")
-            
-            value_list = [v.strip() for v in value_str[1:-1].split(",")]
-            
-            if op == "in":
-                return lambda event: field in event.fields and str(event.fields[field]) in value_list
-            else:  # not in
-                return lambda event: field in event.fields and str(event.fields[field]) not in value_list
-        
-        elif op in ["=~", "!~"]:
-            # Regex pattern
-            pattern = re.compile(value_str.strip('"\''))
-            
-            if op == "=~":
-                return lambda event: field in event.fields and bool(pattern.search(str(event.fields[field])))
-            else:  # !~
-                return lambda event: field in event.fields and not bool(pattern.search(str(event.fields[field])))
-        
-        else:
-            # Simple comparison
-            value = value_str.strip('"\'')
-            
-            if op == "==":
-                return lambda event: field in event.fields and str(event.fields[field]) == value
-            elif op == "!=":
-                return lambda event: field in event.fields and str(event.fields[field]) != value
-            elif op == ">":
-                return lambda event: field in event.fields and float(event.fields[field]) > float(value)
-            elif op == "<":
-                return lambda event: field in event.fields and float(event.fields[field]) < float(value)
-            elif op == ">=":
-                return lambda event: field in event.fields and float(event.fields[field]) >= float(value)
-            elif op == "<=":
-                return lambda event: field in event.fields and float(event.fields[field]) <= float(value)
+        return _compile_condition(condition)
     
     async def process(self, event: LogEvent) -> Optional[LogEvent]:
         """
@@ -221,7 +221,7 @@ class GrokProcessor(Processor):
         # Get the field value
         field_value = None
         if self.field == "raw_data":
-            field_value = event.raw_data
+            field_value = event.raw_text
         else:
             field_value = event.fields.get(self.field)
         
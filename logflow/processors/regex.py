@@ -77,7 +77,7 @@ class RegexProcessor(Processor):
         # Get the field value
         field_value = None
         if self.field == "raw_data":
-            field_value = event.raw_data
+            field_value = event.raw_text
         else:
             field_value = event.fields.get(self.field)
         
@@ -2,7 +2,6 @@
 Elasticsearch sink for LogFlow.
 """
 import asyncio
-from datetime import datetime
 import json
 from typing import Dict, Any, List, Optional
 
@@ -11,6 +10,7 @@ from elasticsearch.helpers import async_bulk
 
 from logflow.core.models import LogEvent
 from logflow.sinks.base import Sink
+from logflow.utils.bulk import build_actions
 
 
 class ElasticsearchSink(Sink):
@@ -31,6 +31,10 @@ class ElasticsearchSink(Sink):
         self.cloud_id = None
         self.ssl_verify = True
         self.batch_size = 1000
+        self.max_connections = 10
+        self.http_compress = True
+        self.use_auto_id = True
+        self._index_cache = {}
     
     async def initialize(self, config: Dict[str, Any]) -> None:
         """
@@ -46,23 +50,35 @@ class ElasticsearchSink(Sink):
                 - cloud_id: Cloud ID for Elastic Cloud
                 - ssl_verify: Whether to verify SSL certificates (default: True)
                 - batch_size: Maximum batch size (default: 1000)
+                - max_connections: Maximum pooled connections per host (default: 10)
+                - http_compress: Whether to gzip bulk request bodies (default: True)
+                - use_auto_id: Let the cluster generate document IDs instead of using
+                  the event ID (default: True). Retried batches may then index
+                  duplicates, so deduplication must happen upstream if required.
         """
         self.hosts = config.get("hosts")
         if not self.hosts:
             raise ValueError("Elasticsearch hosts are required")
         
         self.index = config.get("index", "logs-{yyyy.MM.dd}")
+        self._index_cache = {}
         self.username = config.get("username")
         self.password = config.get("password")
         self.api_key = config.get("api_key")
         self.cloud_id = config.get("cloud_id")
         self.ssl_verify = config.get("ssl_verify", True)
         self.batch_size = int(config.get("batch_size", 1000))
+        self.max_connections = int(config.get("max_connections", 10))
+        self.http_compress = config.get("http_compress", True)
+        self.use_auto_id = config.get("use_auto_id", True)
         
-        # Create the Elasticsearch client
+        # Create the Elasticsearch client with a pooled aiohttp transport
         client_kwargs = {
             "hosts": self.hosts,
             "verify_certs": self.ssl_verify,
+            "node_class": "aiohttp",
+            "connections_per_node": self.max_connections,
+            "http_compress": self.http_compress,
         }
         
         # Add authentication if provided
@@ -76,46 +92,6 @@ class ElasticsearchSink(Sink):
         
         self.client = AsyncElasticsearch(**client_kwargs)
     
-    def _format_index(self, timestamp: datetime) -> str:
-        """
-        Format the index name using the timestamp.
-        
-        Args:
-            timestamp: Timestamp to use for formatting
-            
-        Returns:
-            Formatted index name
-        """
-        return self.index.format(
-            yyyy=timestamp.strftime("%Y"),
-            MM=timestamp.strftime("%m"),
-            dd=timestamp.strftime("%d"),
-            HH=timestamp.strftime("%H")
-        )
-    
-    def _event_to_action(self, event: LogEvent) -> Dict[str, Any]:
-        """
-        Convert a log event to an Elasticsearch bulk action.
-        
-        Args:
-            event: Log event to convert
-            
-        Returns:
-            Elasticsearch bulk action
-        """
-        # Format the index name
-        index = self._format_index(event.timestamp)
-        
-        # Convert the event to a document
-        doc = event.to_dict()
-        
-        # Create the action
-        return {
-            "_index": index,
-            "_id": event.id,
-            "_source": doc
-        }
-    
     async def write(self, events: List[LogEvent]) -> None:
         """
         Write a batch of log events to Elasticsearch.
@@ -127,7 +103,12 @@ class ElasticsearchSink(Sink):
             return
         
         # Convert events to bulk actions
-        actions = [self._event_to_action(event) for event in events]
+        actions = build_actions(
+            events,
+            self.index,
+            self._index_cache,
+            include_id=not self.use_auto_id
+        )
         
         # Send the bulk request
         try:
@@ -76,10 +76,10 @@ class FileSink(Sink):
                 # Write as text using the template
                 context = {
                     "id": event.id,
-                    "timestamp": event.timestamp.isoformat(),
+                    "timestamp": event.isoformat(),
                     "source_type": event.source_type,
                     "source_name": event.source_name,
-                    "raw_data": event.raw_data,
+                    "raw_data": event.raw_text,
                 }
                 
                 # Add fields to context
@@ -90,14 +90,14 @@ class FileSink(Sink):
                 if self.message_field in event.fields:
                     context["message"] = event.fields[self.message_field]
                 else:
-                    context["message"] = event.raw_data
+                    context["message"] = event.raw_text
                 
                 # Format the line using the template
                 try:
                     line = self.template.format(**context) + "\n"
                 except KeyError as e:
                     # If a field is missing, use a simplified format
-                    line = f"{event.timestamp.isoformat()} {event.raw_data}\n"
+                    line = f"{event.isoformat()} {event.raw_text}\n"
             
             # Write the line to the file
             await self.file.write(line)
@@ -2,14 +2,14 @@
 OpenSearch sink for LogFlow.
 """
 import asyncio
-from datetime import datetime
 import json
 from typing import Dict, Any, List, Optional
 
-from opensearchpy import AsyncOpenSearch, helpers
+from opensearchpy import AIOHttpConnection, AsyncOpenSearch, helpers
 
 from logflow.core.models import LogEvent
 from logflow.sinks.base import Sink
+from logflow.utils.bulk import build_actions
 
 
 class OpenSearchSink(Sink):
@@ -29,7 +29,11 @@ class OpenSearchSink(Sink):
         self.api_key = None
         self.ssl_verify = True
         self.batch_size = 1000
+        self._index_cache = {}
         self.timeout = 30
+        self.max_connections = 10
+        self.http_compress = True
+        self.use_auto_id = True
     
     async def initialize(self, config: Dict[str, Any]) -> None:
         """
@@ -45,24 +49,36 @@ class OpenSearchSink(Sink):
                 - ssl_verify: Whether to verify SSL certificates (default: True)
                 - batch_size: Maximum batch size (default: 1000)
                 - timeout: Request timeout in seconds (default: 30)
+                - max_connections: Maximum pooled connections per host (default: 10)
+                - http_compress: Whether to gzip bulk request bodies (default: True)
+                - use_auto_id: Let the cluster generate document IDs instead of using
+                  the event ID (default: True). Retried batches may then index
+                  duplicates, so deduplication must happen upstream if required.
         """
         self.hosts = config.get("hosts")
         if not self.hosts:
             raise ValueError("OpenSearch hosts are required")
         
         self.index = config.get("index", "logs-{yyyy.MM.dd}")
+        self._index_cache = {}
         self.username = config.get("username")
         self.password = config.get("password")
         self.api_key = config.get("api_key")
         self.ssl_verify = config.get("ssl_verify", True)
         self.batch_size = int(config.get("batch_size", 1000))
         self.timeout = int(config.get("timeout", 30))
+        self.max_connections = int(config.get("max_connections", 10))
+        self.http_compress = config.get("http_compress", True)
+        self.use_auto_id = config.get("use_auto_id", True)
         
-        # Create the OpenSearch client
+        # Create the OpenSearch client with a pooled aiohttp transport
         client_kwargs = {
             "hosts": self.hosts,
             "verify_certs": self.ssl_verify,
-            "timeout": self.timeout
+            "timeout": self.timeout,
+            "connection_class": AIOHttpConnection,
+            "maxsize": self.max_connections,
+            "http_compress": self.http_compress
         }
         
         # Add authentication if provided
@@ -73,46 +89,6 @@ class OpenSearchSink(Sink):
         
         self.client = AsyncOpenSearch(**client_kwargs)
     
-    def _format_index(self, timestamp: datetime) -> str:
-        """
-        Format the index name using the timestamp.
-        
-        Args:
-            timestamp: Timestamp to use for formatting
-            
-        Returns:
-            Formatted index name
-        """
-        return self.index.format(
-            yyyy=timestamp.strftime("%Y"),
-            MM=timestamp.strftime("%m"),
-            dd=timestamp.strftime("%d"),
-            HH=timestamp.strftime("%H")
-        )
-    
-    def _event_to_action(self, event: LogEvent) -> Dict[str, Any]:
-        """
-        Convert a log event to an OpenSearch bulk action.
-        
-        Args:
-            event: Log event to convert
-            
-        Returns:
-            OpenSearch bulk action
-        """
-        # Format the index name
-        index = self._format_index(event.timestamp)
-        
-        # Convert the event to a document
-        doc = event.to_dict()
-        
-        # Create the action
-        return {
-            "_index": index,
-            "_id": event.id,
-            "_source": doc
-        }
-    
     async def write(self, events: List[LogEvent]) -> None:
         """
         Write a batch of log events to OpenSearch.
@@ -124,7 +100,12 @@ class OpenSearchSink(Sink):
             return
         
         # Convert events to bulk actions
-        actions = [self._event_to_action(event) for event in events]
+        actions = build_actions(
+            events,
+            self.index,
+            self._index_cache,
+            include_id=not self.use_auto_id
+        )
         
         # Send the bulk request
         try:
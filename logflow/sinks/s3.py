@@ -34,8 +34,12 @@ class S3Sink(Sink):
         self.template = "{timestamp} {message}"
         self.message_field = "message"
         self.buffer_size = 10 * 1024 * 1024  # 10 MB
+        self.multipart_threshold = 8 * 1024 * 1024  # 8 MB
+        self.multipart_part_size = 8 * 1024 * 1024  # 8 MB
+        self.multipart_concurrency = 4
         self.buffer = io.BytesIO()
         self.buffer_count = 0
+        self._buffer_bytes = 0
         self.session = None
     
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -55,6 +59,12 @@ class S3Sink(Sink):
                 - template: Template for text format (default: "{timestamp} {message}")
                 - message_field: Field to use as message in text format (default: "message")
                 - buffer_size: Buffer size in bytes before flushing to S3 (default: 10 MB)
+                - multipart_threshold: Size in bytes from which flushes use a multipart
+                  upload (default: 8 MB)
+                - multipart_part_size: Size in bytes of each multipart part, at least
+                  5 MB (default: 8 MB)
+                - multipart_concurrency: Maximum number of parts uploaded concurrently
+                  (default: 4)
         """
         self.bucket = config.get("bucket")
         if not self.bucket:
@@ -74,6 +84,11 @@ class S3Sink(Sink):
         self.template = config.get("template", "{timestamp} {message}")
         self.message_field = config.get("message_field", "message")
         self.buffer_size = int(config.get("buffer_size", 10 * 1024 * 1024))
+        self.multipart_threshold = int(config.get("multipart_threshold", 8 * 1024 * 1024))
+        self.multipart_part_size = int(config.get("multipart_part_size", 8 * 1024 * 1024))
+        if self.multipart_part_size < 5 * 1024 * 1024:
+            raise ValueError("multipart_part_size must be at least 5 MB")
+        self.multipart_concurrency = int(config.get("multipart_concurrency", 4))
         
         # Create the S3 session
         self.session = aiobotocore.session.get_session()
@@ -117,6 +132,54 @@ class S3Sink(Sink):
         else:
             return f"{date_part}/logs_{timestamp}_{self.buffer_count}.log"
     
+    async def _upload_multipart(self, client, key: str, data: bytes) -> None:
+        """
+        Upload data to S3 as a multipart upload with concurrent part uploads.
+        
+        Args:
+            client: S3 client
+            key: S3 key
+            data: Data to upload
+        """
+        response = await client.create_multipart_upload(Bucket=self.bucket, Key=key)
+        upload_id = response["UploadId"]
+        semaphore = asyncio.Semaphore(self.multipart_concurrency)
+        
+        async def upload_part(part_number: int, offset: int) -> Dict[str, Any]:
+            async with semaphore:
+                part = await client.upload_part(
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data[offset:offset + self.multipart_part_size]
+                )
+            return {"PartNumber": part_number, "ETag": part["ETag"]}
+        
+        try:
+            parts = await asyncio.gather(*[
+                upload_part(part_number, offset)
+                for part_number, offset in enumerate(
+                    range(0, len(data), self.multipart_part_size), start=1
+                )
+            ])
+            
+            await client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts}
+            )
+        
+        except Exception:
+            # Don't leave orphaned parts behind
+            await client.abort_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id
+            )
+            raise
+    
     async def _flush_buffer(self) -> None:
         """
         Flush the buffer to S3.
@@ -124,8 +187,7 @@ class S3Sink(Sink):
         if self.buffer_count == 0:
             return
         
-        # Reset the buffer position
-        self.buffer.seek(0)
+        data = self.buffer.getvalue()
         
         # Generate the S3 key
         key = self._generate_key()
@@ -133,15 +195,19 @@ class S3Sink(Sink):
         try:
             # Upload the buffer to S3
             async with await self._get_client() as client:
-                await client.put_object(
-                    Bucket=self.bucket,
-                    Key=key,
-                    Body=self.buffer.read()
-                )
+                if len(data) >= self.multipart_threshold:
+                    await self._upload_multipart(client, key, data)
+                else:
+                    await client.put_object(
+                        Bucket=self.bucket,
+                        Key=key,
+                        Body=data
+                    )
             
             # Reset the buffer
             self.buffer = io.BytesIO()
             self.buffer_count = 0
+            self._buffer_bytes = 0
         
         except Exception as e:
             # Log the error
@@ -166,10 +232,10 @@ class S3Sink(Sink):
                 # Write as text using the template
                 context = {
                     "id": event.id,
-                    "timestamp": event.timestamp.isoformat(),
+                    "timestamp": event.isoformat(),
                     "source_type": event.source_type,
                     "source_name": event.source_name,
-                    "raw_data": event.raw_data,
+                    "raw_data": event.raw_text,
                 }
                 
                 # Add fields to context
@@ -180,21 +246,23 @@ class S3Sink(Sink):
                 if self.message_field in event.fields:
                     context["message"] = event.fields[self.message_field]
                 else:
-                    context["message"] = event.raw_data
+                    context["message"] = event.raw_text
                 
                 # Format the line using the template
                 try:
                     line = self.template.format(**context) + "\n"
                 except KeyError as e:
                     # If a field is missing, use a simplified format
-                    line = f"{event.timestamp.isoformat()} {event.raw_data}\n"
+                    line = f"{event.isoformat()} {event.raw_text}\n"
             
             # Write the line to the buffer
-            self.buffer.write(line.encode("utf-8"))
+            line_bytes = line.encode("utf-8")
+            self.buffer.write(line_bytes)
+            self._buffer_bytes += len(line_bytes)
             self.buffer_count += 1
         
         # Flush the buffer if it's full
-        if self.buffer.tell() >= self.buffer_size:
+        if self._buffer_bytes >= self.buffer_size:
             await self._flush_buffer()
     
     async def shutdown(self) -> None:
@@ -1,8 +1,9 @@
 """
 Base interface for log sources.
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Dict, Any
+from typing import AsyncIterator, Dict, Any, List, Union
 
 from logflow.core.models import LogEvent
 
@@ -26,15 +27,100 @@ class Source(ABC):
         pass
     
     @abstractmethod
-    async def read(self) -> AsyncIterator[LogEvent]:
+    async def read(self) -> AsyncIterator[Union[LogEvent, List[LogEvent]]]:
         """
         Read log events from the source.
         
+        High-volume sources may yield lists of events to amortize the cost
+        of resuming the generator over many events.
+        
         Yields:
-            LogEvent objects
+            LogEvent objects or lists of LogEvent objects
         """
         pass
     
+    async def batched(self, size: int = 1000, interval: float = 0.2) -> AsyncIterator[List[LogEvent]]:
+        """
+        Read log events from the source in batches.
+        
+        A batch is yielded once it holds ``size`` events or ``interval``
+        seconds after its first event arrived, whichever comes first. Lists
+        of events yielded by the source are merged into the batch. When the
+        source ends, any remaining partial batch is yielded before the
+        iterator finishes; closing the iterator early discards it.
+        
+        Args:
+            size: Maximum number of events per batch
+            interval: Maximum time in seconds to hold a partial batch
+            
+        Yields:
+            Lists of LogEvent objects
+        """
+        loop = asyncio.get_running_loop()
+        events = self.read()
+        batch: List[LogEvent] = []
+        deadline = None
+        pending = None
+        
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(events.__anext__())
+                
+                # Wait for the next event, but no longer than the batch deadline
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                
+                if done:
+                    future, pending = pending, None
+                    try:
+                        item = future.result()
+                    except StopAsyncIteration:
+                        break
+                    
+                    if isinstance(item, list):
+                        batch.extend(item)
+                    else:
+                        batch.append(item)
+                    
+                    if deadline is None and batch:
+                        deadline = loop.time() + interval
+                    
+                    # Yield full batches, keeping any overflow for the next one
+                    if len(batch) >= size:
+                        while len(batch) >= size:
+                            yield batch[:size]
+                            batch = batch[size:]
+                        deadline = loop.time() + interval if batch else None
+                    
+                    continue
+                
+                yield batch
+                batch = []
+                deadline = None
+            
+            # Yield any remaining events
+            if batch:
+                yield batch
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.wait({pending})
+                # Retrieve the outcome so it is not reported as never retrieved
+                if not pending.cancelled():
+                    pending.exception()
+            await events.aclose()
+    
+    async def stop(self) -> None:
+        """
+        Signal the source to stop reading.
+        
+        The pipeline calls this before waiting for its source tasks, and
+        only calls shutdown() once they have finished. The default clears
+        the ``running`` flag that sources check between reads.
+        """
+        self.running = False
+    
     @abstractmethod
     async def shutdown(self) -> None:
         """
@@ -4,7 +4,6 @@ File source for LogFlow.
 import asyncio
 import os
 import time
-from datetime import datetime
 from typing import AsyncIterator, Dict, Any, Optional
 
 import aiofiles
@@ -119,7 +118,6 @@ class FileSource(Source):
                                 raw_data=line.strip(),
                                 source_type="file",
                                 source_name=self.path,
-                                timestamp=datetime.utcnow(),
                                 metadata={
                                     "file_path": self.path,
                                     "file_position": self.position - len(line)
@@ -2,15 +2,21 @@
 Kafka source for LogFlow.
 """
 import asyncio
-from datetime import datetime
+import logging
+import random
 from typing import AsyncIterator, Dict, Any, List, Optional
 
 from aiokafka import AIOKafkaConsumer
+from aiokafka.errors import CommitFailedError
 
 from logflow.core.models import LogEvent
 from logflow.sources.base import Source
 
 
+# Set up logging
+logger = logging.getLogger("logflow.sources.kafka")
+
+
 class KafkaSource(Source):
     """
     Source that reads logs from Kafka topics.
@@ -18,7 +24,7 @@ class KafkaSource(Source):
     Features:
     - Subscribes to one or more Kafka topics
     - Supports consumer groups for distributed processing
-    - Automatic offset management
+    - Batched offset commits
     """
     
     def __init__(self):
@@ -33,6 +39,21 @@ class KafkaSource(Source):
         self.auto_offset_reset = "latest"
         self.max_poll_records = 500
         self.consumer_timeout_ms = 1000
+        self.session_timeout_ms = 10000
+        self.heartbeat_interval_ms = 3000
+        self.max_poll_interval_ms = 300000
+        self.rebalance_timeout_ms = None
+        self.request_timeout_ms = 40000
+        self.fetch_max_bytes = 50 * 1024 * 1024
+        self.fetch_min_bytes = 1
+        self.max_partition_fetch_bytes = 5 * 1024 * 1024
+        self.check_crcs = True
+        self.include_keys = True
+        self.decode_values = True
+        self.commit_batch_size = 500
+        self.commit_interval_ms = 5000
+        self.batch_size = 64
+        self.error_backoff = 1.0  # seconds
         self.metadata = {}
     
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -48,6 +69,38 @@ class KafkaSource(Source):
                   (default: "latest", options: "earliest", "latest")
                 - max_poll_records: Maximum number of records to fetch in a single poll (default: 500)
                 - consumer_timeout_ms: Timeout for consumer operations in milliseconds (default: 1000)
+                - session_timeout_ms: Time in milliseconds without heartbeats before the
+                  consumer is removed from the group (default: 10000)
+                - heartbeat_interval_ms: Interval in milliseconds between heartbeats
+                  (default: 3000)
+                - max_poll_interval_ms: Maximum time in milliseconds between polls before
+                  the consumer leaves the group. Keep it above max_poll_records times the
+                  time to process a record, with a safety margin, when raising
+                  max_poll_records (default: 300000)
+                - rebalance_timeout_ms: Time in milliseconds the group waits for members
+                  to rejoin during a rebalance (default: session_timeout_ms)
+                - request_timeout_ms: Timeout in milliseconds for broker requests
+                  (default: 40000)
+                - fetch_max_bytes: Maximum amount of data returned by a fetch request
+                  (default: 50 MB)
+                - fetch_min_bytes: Minimum amount of data the broker should return for
+                  a fetch request (default: 1)
+                - max_partition_fetch_bytes: Maximum amount of data returned per partition
+                  by a fetch request (default: 5 MB)
+                - check_crcs: Whether to verify the CRC32 of consumed records. Disabling
+                  it saves CPU on large batches (default: True)
+                - commit_batch_size: Number of messages to read before committing offsets
+                  (default: 500)
+                - commit_interval_ms: Maximum time in milliseconds between offset commits
+                  (default: 5000)
+                - include_keys: Whether to decode message keys into the kafka_key
+                  metadata (default: True)
+                - decode_values: Whether to decode message values to strings. When False,
+                  raw_data holds the value bytes, which suits processors that accept
+                  bytes such as the JSON processor (default: True)
+                - batch_size: Maximum number of events yielded at once (default: 64)
+                - error_backoff: Base delay in seconds before retrying after an error,
+                  randomized by +/-50% (default: 1.0)
                 - metadata: Additional metadata to include with each event (default: {})
         """
         self.brokers = config.get("brokers")
@@ -62,6 +115,26 @@ class KafkaSource(Source):
         self.auto_offset_reset = config.get("auto_offset_reset", "latest")
         self.max_poll_records = int(config.get("max_poll_records", 500))
         self.consumer_timeout_ms = int(config.get("consumer_timeout_ms", 1000))
+        self.session_timeout_ms = int(config.get("session_timeout_ms", 10000))
+        self.heartbeat_interval_ms = int(config.get("heartbeat_interval_ms", 3000))
+        self.max_poll_interval_ms = int(config.get("max_poll_interval_ms", 300000))
+        self.rebalance_timeout_ms = config.get("rebalance_timeout_ms")
+        self.request_timeout_ms = int(config.get("request_timeout_ms", 40000))
+        
+        if self.heartbeat_interval_ms >= self.session_timeout_ms:
+            raise ValueError("heartbeat_interval_ms must be lower than session_timeout_ms")
+        self.fetch_max_bytes = int(config.get("fetch_max_bytes", 50 * 1024 * 1024))
+        self.fetch_min_bytes = int(config.get("fetch_min_bytes", 1))
+        self.max_partition_fetch_bytes = int(
+            config.get("max_partition_fetch_bytes", 5 * 1024 * 1024)
+        )
+        self.check_crcs = config.get("check_crcs", True)
+        self.include_keys = config.get("include_keys", True)
+        self.decode_values = config.get("decode_values", True)
+        self.commit_batch_size = int(config.get("commit_batch_size", 500))
+        self.commit_interval_ms = int(config.get("commit_interval_ms", 5000))
+        self.batch_size = int(config.get("batch_size", 64))
+        self.error_backoff = float(config.get("error_backoff", 1.0))
         self.metadata = config.get("metadata", {})
         
         # Create the Kafka consumer
@@ -72,53 +145,127 @@ class KafkaSource(Source):
             auto_offset_reset=self.auto_offset_reset,
             max_poll_records=self.max_poll_records,
             consumer_timeout_ms=self.consumer_timeout_ms,
-            enable_auto_commit=True
+            session_timeout_ms=self.session_timeout_ms,
+            heartbeat_interval_ms=self.heartbeat_interval_ms,
+            max_poll_interval_ms=self.max_poll_interval_ms,
+            rebalance_timeout_ms=self.rebalance_timeout_ms,
+            request_timeout_ms=self.request_timeout_ms,
+            fetch_max_bytes=self.fetch_max_bytes,
+            fetch_min_bytes=self.fetch_min_bytes,
+            max_partition_fetch_bytes=self.max_partition_fetch_bytes,
+            check_crcs=self.check_crcs,
+            enable_auto_commit=False
         )
         
         # Start the consumer
         await self.consumer.start()
     
-    async def read(self) -> AsyncIterator[LogEvent]:
+    async def _commit(self, offsets: Dict[Any, int]) -> None:
+        """
+        Commit offsets for the messages that were read.
+        
+        Args:
+            offsets: Next offset to read for each topic partition
+        """
+        try:
+            await self.consumer.commit(offsets)
+        except CommitFailedError as e:
+            # The group rebalanced, so the partitions' new owners resume from the
+            # last committed offsets
+            logger.warning(f"Error committing Kafka offsets: {str(e)}")
+    
+    async def read(self) -> AsyncIterator[List[LogEvent]]:
         """
         Read log events from Kafka.
         
+        The messages of each poll are yielded in lists of up to
+        ``batch_size`` events.
+        
         Yields:
-            LogEvent objects
+            Lists of LogEvent objects
         """
         self.running = True
         
+        loop = asyncio.get_running_loop()
+        offsets: Dict[Any, int] = {}
+        uncommitted = 0
+        last_commit_time = loop.time()
+        
         try:
             while self.running:
                 try:
-                    # Poll for messages
-                    async for message in self.consumer:
-                        if not self.running:
-                            break
-                        
-                        # Get the message value as string
-                        try:
-                            raw_data = message.value.decode("utf-8")
-                        except (UnicodeDecodeError, AttributeError):
-                            # If decoding fails, use the raw bytes as string representation
-                            raw_data = str(message.value)
-                        
-                        # Create and yield a log event
-                        event = LogEvent(
-                            raw_data=raw_data,
-                            source_type="kafka",
-                            source_name=message.topic,
-                            timestamp=datetime.utcnow(),
-                            metadata={
+                    # Poll for a batch of messages
+                    records = await self.consumer.getmany(
+                        timeout_ms=self.consumer_timeout_ms,
+                        max_records=self.max_poll_records
+                    )
+                    
+                    batch: List[LogEvent] = []
+                    batch_offsets: Dict[Any, int] = {}
+                    
+                    for tp, messages in records.items():
+                        for message in messages:
+                            if not self.running:
+                                break
+                            
+                            # Get the message value, replacing invalid UTF-8 when decoding
+                            raw_data = message.value
+                            if raw_data is None:
+                                raw_data = "" if self.decode_values else b""
+                            elif self.decode_values:
+                                raw_data = raw_data.decode("utf-8", errors="replace")
+                            
+                            # Build the metadata, letting configured metadata win
+                            metadata = {
                                 "kafka_topic": message.topic,
                                 "kafka_partition": message.partition,
                                 "kafka_offset": message.offset,
                                 "kafka_timestamp": message.timestamp,
-                                "kafka_key": message.key.decode("utf-8") if message.key else None,
-                                **self.metadata
                             }
-                        )
+                            if self.include_keys:
+                                metadata["kafka_key"] = message.key.decode("utf-8") if message.key else None
+                            if self.metadata:
+                                metadata.update(self.metadata)
+                            
+                            # Use the record timestamp (ms) when the broker set one
+                            timestamp_ns = None
+                            if message.timestamp is not None and message.timestamp >= 0:
+                                timestamp_ns = message.timestamp * 1_000_000
+                            
+                            # Create a log event
+                            batch.append(LogEvent(
+                                raw_data=raw_data,
+                                source_type="kafka",
+                                source_name=message.topic,
+                                timestamp_ns=timestamp_ns,
+                                metadata=metadata
+                            ))
+                            batch_offsets[tp] = message.offset + 1
+                            
+                            if len(batch) >= self.batch_size:
+                                yield batch
+                                
+                                offsets.update(batch_offsets)
+                                uncommitted += len(batch)
+                                batch = []
+                                batch_offsets = {}
+                    
+                    # Yield the rest of the poll
+                    if batch:
+                        yield batch
                         
-                        yield event
+                        offsets.update(batch_offsets)
+                        uncommitted += len(batch)
+                    
+                    # Commit offsets once per batch of messages or interval
+                    if self.group_id and offsets and (
+                        uncommitted >= self.commit_batch_size or
+                        (loop.time() - last_commit_time) * 1000 >= self.commit_interval_ms
+                    ):
+                        await self._commit(offsets)
+                        offsets = {}
+                        uncommitted = 0
+                        last_commit_time = loop.time()
                 
                 except asyncio.CancelledError:
                     # Handle cancellation
@@ -126,10 +273,14 @@ class KafkaSource(Source):
                 
                 except Exception as e:
                     # Log the error and continue
-                    print(f"Error reading from Kafka: {str(e)}")
-                    await asyncio.sleep(1)
+                    logger.warning(f"Error reading from Kafka: {str(e)}", exc_info=True)
+                    await asyncio.sleep(self.error_backoff * (0.5 + random.random()))
         
         finally:
+            # Commit the offsets of the messages read since the last commit
+            if self.group_id and offsets and self.consumer and self.consumer._closed is False:
+                await self._commit(offsets)
+            
             # Ensure the consumer is stopped if we exit the loop
             if self.consumer and self.consumer._closed is False:
                 await self.consumer.stop()
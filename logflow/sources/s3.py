@@ -2,8 +2,12 @@
 S3 source for LogFlow.
 """
 import asyncio
+import codecs
 import io
-from datetime import datetime
+import logging
+import random
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import AsyncIterator, Dict, Any, List, Optional
 
 import aiobotocore.session
@@ -12,6 +16,123 @@ from logflow.core.models import LogEvent
 from logflow.sources.base import Source
 
 
+# Set up logging
+logger = logging.getLogger("logflow.sources.s3")
+
+
+async def _list_keys(client, paginate_kwargs: Dict[str, Any]) -> List[str]:
+    """
+    List object keys with the list_objects_v2 paginator.
+    
+    Args:
+        client: S3 client
+        paginate_kwargs: Arguments for the paginator
+        
+    Returns:
+        List of object keys, in lexical order
+    """
+    paginator = client.get_paginator("list_objects_v2")
+    keys = []
+    
+    async for page in paginator.paginate(**paginate_kwargs):
+        if "Contents" in page:
+            for obj in page["Contents"]:
+                keys.append(obj["Key"])
+    
+    return keys
+
+
+async def _iter_lines(client, bucket: str, key: str, read_buffer_size: int) -> AsyncIterator[List[str]]:
+    """
+    Stream the lines of an S3 object.
+    
+    The object is decoded one chunk at a time, carrying any partial line
+    over to the next chunk.
+    
+    Args:
+        client: S3 client
+        bucket: S3 bucket name
+        key: S3 object key
+        read_buffer_size: Size in bytes of each read from the object body
+        
+    Yields:
+        Lists of lines, one list per chunk
+    """
+    response = await client.get_object(Bucket=bucket, Key=key)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    tail = ""
+    
+    async with response["Body"] as stream:
+        while True:
+            chunk = await stream.read(read_buffer_size)
+            text = tail + decoder.decode(chunk, final=not chunk)
+            
+            if chunk:
+                end = text.rfind("\n")
+                if end < 0:
+                    tail = text
+                    continue
+                text, tail = text[:end], text[end + 1:]
+            
+            yield text.splitlines()
+            
+            if not chunk:
+                break
+
+
+async def _read_lines(client, bucket: str, key: str, read_buffer_size: int) -> List[str]:
+    """
+    Read the non-empty lines of an S3 object.
+    
+    Args:
+        client: S3 client
+        bucket: S3 bucket name
+        key: S3 object key
+        read_buffer_size: Size in bytes of each read from the object body
+        
+    Returns:
+        List of lines
+    """
+    return [
+        line
+        async for lines in _iter_lines(client, bucket, key, read_buffer_size)
+        for line in lines
+        if line.strip()
+    ]
+
+
+async def _call_with_client(client_kwargs: Dict[str, Any], func, *args) -> Any:
+    """
+    Call a function with a new S3 client.
+    
+    Args:
+        client_kwargs: Arguments for creating the client
+        func: Coroutine function taking the client as first argument
+        *args: Additional arguments for the function
+        
+    Returns:
+        Result of the function
+    """
+    session = aiobotocore.session.get_session()
+    async with session.create_client("s3", **client_kwargs) as client:
+        return await func(client, *args)
+
+
+def _run_isolated(client_kwargs: Dict[str, Any], func, *args) -> Any:
+    """
+    Run an S3 operation on its own event loop in a worker process.
+    
+    Args:
+        client_kwargs: Arguments for creating the client
+        func: Coroutine function taking the client as first argument
+        *args: Additional arguments for the function
+        
+    Returns:
+        Result of the function
+    """
+    return asyncio.run(_call_with_client(client_kwargs, func, *args))
+
+
 class S3Source(Source):
     """
     Source that reads logs from Amazon S3.
@@ -34,10 +155,22 @@ class S3Source(Source):
         self.aws_session_token = None
         self.endpoint_url = None
         self.poll_interval = 60.0  # seconds
-        self.processed_keys = set()
+        self.error_backoff = 60.0  # seconds
+        self.concurrency = 16
+        self.read_buffer_size = 64 * 1024
+        self.start_after = False
+        self.max_processed_keys = 100000
+        self.batch_size = 64
+        self.subprocess_isolation = False
+        self.processed_keys: "OrderedDict[str, None]" = OrderedDict()
+        self._marker = ""
+        self._warned_processed_keys = False
         self.running = False
+        self._stopped = None
         self.session = None
         self.client = None
+        self._client_context = None
+        self._executor = None
     
     async def initialize(self, config: Dict[str, Any]) -> None:
         """
@@ -53,6 +186,27 @@ class S3Source(Source):
                 - aws_session_token: AWS session token (optional)
                 - endpoint_url: Custom endpoint URL for S3 (optional)
                 - poll_interval: Interval in seconds to poll for new files (default: 60.0)
+                - error_backoff: Base delay in seconds before retrying after an error,
+                  randomized by +/-50% (default: poll_interval)
+                - concurrency: Maximum number of objects downloaded concurrently (default: 16)
+                - read_buffer_size: Size in bytes of each read from an object body
+                  (default: 64 KiB)
+                - start_after: Whether new keys always sort after the keys already
+                  processed (e.g. date-based keys from a single writer), so listings can
+                  resume after the last processed key instead of re-listing the prefix.
+                  Keys that arrive out of order are never listed when enabled
+                  (default: False)
+                - max_processed_keys: Maximum number of processed keys remembered for
+                  deduplication when start_after is enabled. Keys past the listing
+                  marker are kept even beyond this limit until the marker passes
+                  them, since they are still listed. Without start_after every key
+                  is remembered, since the whole prefix is listed on every poll, and
+                  a warning is logged once this limit is exceeded (default: 100000)
+                - batch_size: Maximum number of events yielded at once (default: 64)
+                - subprocess_isolation: Whether to run S3 calls in a worker process with
+                  its own event loop, for when LogFlow is embedded in an application
+                  whose loop interferes with aiobotocore. Each call creates its own
+                  client and objects are read whole (default: False)
         """
         self.bucket = config.get("bucket")
         if not self.bucket:
@@ -65,16 +219,30 @@ class S3Source(Source):
         self.aws_session_token = config.get("aws_session_token")
         self.endpoint_url = config.get("endpoint_url")
         self.poll_interval = float(config.get("poll_interval", 60.0))
+        self.error_backoff = float(config.get("error_backoff", self.poll_interval))
+        self.concurrency = int(config.get("concurrency", 16))
+        self.read_buffer_size = int(config.get("read_buffer_size", 64 * 1024))
+        self.start_after = config.get("start_after", False)
+        self.max_processed_keys = int(config.get("max_processed_keys", 100000))
+        self.batch_size = int(config.get("batch_size", 64))
+        self.subprocess_isolation = config.get("subprocess_isolation", False)
+        
+        if self.subprocess_isolation:
+            # S3 calls run in a worker process instead of on this loop
+            self._executor = ProcessPoolExecutor(max_workers=1)
+            return
         
-        # Create the S3 client
+        # Create the S3 client, reused across poll cycles
         self.session = aiobotocore.session.get_session()
+        self._client_context = await self._get_client()
+        self.client = await self._client_context.__aenter__()
     
-    async def _get_client(self):
+    def _client_kwargs(self) -> Dict[str, Any]:
         """
-        Get an S3 client.
+        Get the arguments for creating an S3 client.
         
         Returns:
-            S3 client
+            Client arguments
         """
         client_kwargs = {
             "region_name": self.region,
@@ -90,32 +258,134 @@ class S3Source(Source):
         if self.endpoint_url:
             client_kwargs["endpoint_url"] = self.endpoint_url
         
-        return self.session.create_client("s3", **client_kwargs)
+        return client_kwargs
+    
+    async def _get_client(self):
+        """
+        Get an S3 client.
+        
+        Returns:
+            S3 client
+        """
+        return self.session.create_client("s3", **self._client_kwargs())
+    
+    async def _run_isolated(self, func, *args) -> Any:
+        """
+        Run an S3 operation in the worker process.
+        
+        Args:
+            func: Module-level coroutine function taking the client as first argument
+            *args: Additional arguments for the function
+            
+        Returns:
+            Result of the function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, _run_isolated, self._client_kwargs(), func, *args
+        )
     
     async def _list_objects(self, client):
         """
         List objects in the S3 bucket.
         
+        When ``start_after`` is enabled, only keys after the listing marker
+        are returned.
+        
         Args:
             client: S3 client
             
         Returns:
-            List of object keys
+            List of object keys, in lexical order
         """
-        paginator = client.get_paginator("list_objects_v2")
+        paginate_kwargs = {
+            "Bucket": self.bucket,
+            "Prefix": self.prefix,
+            "PaginationConfig": {"PageSize": 1000}
+        }
+        if self.start_after and self._marker:
+            paginate_kwargs["StartAfter"] = self._marker
         
-        new_keys = []
+        if self._executor is not None:
+            return await self._run_isolated(_list_keys, paginate_kwargs)
         
-        async for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
-            if "Contents" in page:
-                for obj in page["Contents"]:
-                    key = obj["Key"]
-                    if key not in self.processed_keys:
-                        new_keys.append(key)
+        return await _list_keys(client, paginate_kwargs)
+    
+    def _mark_processed(self, key: str) -> None:
+        """
+        Remember a processed key, evicting the least recently processed keys
+        beyond ``max_processed_keys`` when ``start_after`` is enabled.
+        
+        A key that keeps failing holds the listing marker back, and the keys
+        processed after it are still listed on every poll. Only keys at or
+        before the marker are evicted, so those keys are not processed again.
+        Without ``start_after`` every key is listed on every poll, so no key
+        is evicted.
+        
+        Args:
+            key: S3 object key
+        """
+        self.processed_keys[key] = None
+        self.processed_keys.move_to_end(key)
+        
+        if len(self.processed_keys) <= self.max_processed_keys:
+            return
+        
+        if not self.start_after:
+            if not self._warned_processed_keys:
+                logger.warning(
+                    f"Remembering more than {self.max_processed_keys} processed keys "
+                    f"of s3://{self.bucket}/{self.prefix}; enable start_after to "
+                    f"bound the memory used for deduplication"
+                )
+                self._warned_processed_keys = True
+            return
         
-        return new_keys
+        while len(self.processed_keys) > self.max_processed_keys:
+            oldest = next(iter(self.processed_keys))
+            if oldest > self._marker:
+                break
+            self.processed_keys.popitem(last=False)
+    
+    def _advance_marker(self, keys: List[str]) -> None:
+        """
+        Move the listing marker past the leading run of processed keys.
+        
+        The marker stops at the first key that failed, so it is listed and
+        retried on the next poll. Keys behind the marker are no longer
+        listed, so they are dropped from ``processed_keys``.
+        
+        Args:
+            keys: Listed object keys, in lexical order
+        """
+        for key in keys:
+            if key not in self.processed_keys:
+                break
+            self._marker = key
+            del self.processed_keys[key]
     
-    async def _process_object(self, client, key):
+    async def _iter_object_lines(self, client, key: str) -> AsyncIterator[List[str]]:
+        """
+        Read the lines of an S3 object.
+        
+        Objects are streamed chunk by chunk, or read whole in the worker
+        process when ``subprocess_isolation`` is enabled.
+        
+        Args:
+            client: S3 client
+            key: S3 object key
+            
+        Yields:
+            Lists of lines
+        """
+        if self._executor is not None:
+            yield await self._run_isolated(_read_lines, self.bucket, key, self.read_buffer_size)
+            return
+        
+        async for lines in _iter_lines(client, self.bucket, key, self.read_buffer_size):
+            yield lines
+    
+    async def _process_object(self, client, key) -> AsyncIterator[List[LogEvent]]:
         """
         Process an S3 object.
         
@@ -124,67 +394,124 @@ class S3Source(Source):
             key: S3 object key
             
         Yields:
-            LogEvent objects
+            Lists of up to ``batch_size`` LogEvent objects
         """
         try:
-            # Get the object
-            response = await client.get_object(Bucket=self.bucket, Key=key)
-            
-            # Read the object data
-            async with response["Body"] as stream:
-                data = await stream.read()
+            source_name = f"s3://{self.bucket}/{key}"
+            metadata = {
+                "s3_bucket": self.bucket,
+                "s3_key": key,
+                "s3_region": self.region
+            }
             
             # Process the data line by line
-            text = data.decode("utf-8")
-            for line in text.splitlines():
-                if line.strip():
-                    # Create and yield a log event
-                    event = LogEvent(
-                        raw_data=line,
-                        source_type="s3",
-                        source_name=f"s3://{self.bucket}/{key}",
-                        timestamp=datetime.utcnow(),
-                        metadata={
-                            "s3_bucket": self.bucket,
-                            "s3_key": key,
-                            "s3_region": self.region
-                        }
-                    )
-                    
-                    yield event
+            async for lines in self._iter_object_lines(client, key):
+                batch: List[LogEvent] = []
+                for line in lines:
+                    if line.strip():
+                        # Create a log event
+                        batch.append(LogEvent(
+                            raw_data=line,
+                            source_type="s3",
+                            source_name=source_name,
+                            metadata=dict(metadata)
+                        ))
+                        
+                        if len(batch) >= self.batch_size:
+                            yield batch
+                            batch = []
+                
+                if batch:
+                    yield batch
             
             # Mark the key as processed
-            self.processed_keys.add(key)
+            self._mark_processed(key)
         
         except Exception as e:
             # Log the error and continue
-            print(f"Error processing S3 object {key}: {str(e)}")
+            logger.warning(f"Error processing S3 object {key}: {str(e)}", exc_info=True)
     
-    async def read(self) -> AsyncIterator[LogEvent]:
+    async def _process_objects(self, client, keys: List[str]) -> AsyncIterator[List[LogEvent]]:
+        """
+        Process S3 objects concurrently.
+        
+        Up to ``concurrency`` workers download objects and pass their events
+        through a bounded queue, so slow consumers hold back the downloads.
+        
+        Args:
+            client: S3 client
+            keys: S3 object keys
+            
+        Yields:
+            Lists of LogEvent objects
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 4)
+        pending_keys = iter(keys)
+        
+        async def worker() -> None:
+            for key in pending_keys:
+                async for batch in self._process_object(client, key):
+                    await queue.put(batch)
+            
+            # Signal that this worker is done
+            await queue.put(None)
+        
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.concurrency, len(keys)))
+        ]
+        remaining = len(workers)
+        
+        try:
+            while remaining and self.running:
+                batch = await queue.get()
+                if batch is None:
+                    remaining -= 1
+                    continue
+                
+                yield batch
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    
+    async def _sleep(self, delay: float) -> None:
+        """
+        Sleep for up to ``delay`` seconds, returning early once the source is stopped.
+        
+        Args:
+            delay: Time to sleep in seconds
+        """
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def read(self) -> AsyncIterator[List[LogEvent]]:
         """
         Read log events from S3.
         
         Yields:
-            LogEvent objects
+            Lists of LogEvent objects
         """
         self.running = True
+        self._stopped = asyncio.Event()
         
         while self.running:
             try:
-                async with await self._get_client() as client:
-                    # List objects in the bucket
-                    keys = await self._list_objects(client)
-                    
-                    # Process each object
-                    for key in keys:
-                        if not self.running:
-                            break
-                        
-                        async for event in self._process_object(client, key):
-                            yield event
+                # List objects in the bucket
+                keys = await self._list_objects(self.client)
+                new_keys = [key for key in keys if key not in self.processed_keys]
+                
+                # Process the objects concurrently
+                async for batch in self._process_objects(self.client, new_keys):
+                    yield batch
+                
+                if self.start_after:
+                    self._advance_marker(keys)
                 
                 # Wait before polling again
-                await asyncio.sleep(self.poll_interval)
+                await self._sleep(self.poll_interval)
             
             except asyncio.CancelledError:
                 # Handle cancellation
@@ -192,11 +519,28 @@ class S3Source(Source):
             
             except Exception as e:
                 # Log the error and continue
-                print(f"Error reading from S3: {str(e)}")
-                await asyncio.sleep(self.poll_interval)
+                logger.warning(f"Error reading from S3: {str(e)}", exc_info=True)
+                await self._sleep(self.error_backoff * (0.5 + random.random()))
+    
+    async def stop(self) -> None:
+        """
+        Signal the source to stop reading, waking it from any poll sleep.
+        """
+        self.running = False
+        if self._stopped:
+            self._stopped.set()
     
     async def shutdown(self) -> None:
         """
         Perform cleanup and release resources.
         """
-        self.running = False
\ No newline at end of file
+        self.running = False
+        
+        if self._client_context:
+            await self._client_context.__aexit__(None, None, None)
+            self._client_context = None
+            self.client = None
+        
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
\ No newline at end of file
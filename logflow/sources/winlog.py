@@ -2,16 +2,55 @@
 Windows Event Log source for LogFlow.
 """
 import asyncio
-import json
+import functools
+import logging
 import os
+import random
 import re
 import subprocess
 import tempfile
-from datetime import datetime
-from typing import AsyncIterator, Dict, Any, List, Optional
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Any, List, Optional, Union
+
+import aiofiles
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:  # pragma: no cover - depends on the environment
+    _parse_iso_datetime = None
 
 from logflow.core.models import LogEvent
 from logflow.sources.base import Source
+from logflow.utils.serialization import dumps, loads
+
+
+# Set up logging
+logger = logging.getLogger("logflow.sources.winlog")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_timestamp(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp, caching the result.
+    
+    Events from the same burst often share a timestamp, so repeated
+    strings are served from the cache. Uses ciso8601 when it is installed.
+    
+    Args:
+        value: ISO 8601 timestamp
+        
+    Returns:
+        Parsed datetime, or None if the value is not a valid timestamp
+    """
+    try:
+        if _parse_iso_datetime is not None:
+            return _parse_iso_datetime(value)
+        
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
 
 
 class WinlogSource(Source):
@@ -31,11 +70,20 @@ class WinlogSource(Source):
         self.level = None
         self.event_ids = []
         self.providers = []
+        self._channels_set = None
+        self._event_ids_set = None
+        self._providers_set = None
         self.poll_interval = 10.0  # seconds
+        self.error_backoff = 10.0  # seconds
+        self.read_buffer_size = 64 * 1024
         self.tail = True
         self.host = "0.0.0.0"
         self.port = 5044
+        self.queue_size = 10000
+        self.batch_size = 64
+        self._event_queue = None
         self.running = False
+        self._stopped = None
         self.processed_files = set()
     
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -51,9 +99,15 @@ class WinlogSource(Source):
                 - event_ids: List of event IDs to filter
                 - providers: List of event providers to filter
                 - poll_interval: Interval in seconds to poll for new events
+                - error_backoff: Base delay in seconds before retrying after an error,
+                  randomized by +/-50% (default: poll_interval)
+                - read_buffer_size: Size in bytes of each file or socket read
+                  (default: 64 KiB)
                 - tail: Whether to continuously read new events
                 - host: Host to bind to for TCP mode
                 - port: Port to bind to for TCP mode
+                - queue_size: Maximum number of received events buffered in TCP mode
+                - batch_size: Maximum number of events yielded at once (default: 64)
         """
         self.mode = config.get("mode", "file")
         if self.mode not in ["file", "directory", "tcp"]:
@@ -68,9 +122,13 @@ class WinlogSource(Source):
         self.event_ids = config.get("event_ids", [])
         self.providers = config.get("providers", [])
         self.poll_interval = float(config.get("poll_interval", 10.0))
+        self.error_backoff = float(config.get("error_backoff", self.poll_interval))
+        self.read_buffer_size = int(config.get("read_buffer_size", 64 * 1024))
         self.tail = config.get("tail", True)
         self.host = config.get("host", "0.0.0.0")
         self.port = int(config.get("port", 5044))
+        self.queue_size = int(config.get("queue_size", 10000))
+        self.batch_size = int(config.get("batch_size", 64))
         
         # Validate configuration
         if self.mode == "file" and not os.path.isfile(self.path):
@@ -81,109 +139,233 @@ class WinlogSource(Source):
         
         if self.level is not None and not (1 <= self.level <= 5):
             raise ValueError("Level must be between 1 and 5")
+        
+        # Pre-compute the filters as sets for constant-time lookups
+        self._channels_set = frozenset(self.channels) if self.channels else None
+        self._event_ids_set = frozenset(self.event_ids) if self.event_ids else None
+        self._providers_set = frozenset(self.providers) if self.providers else None
+    
+    @staticmethod
+    def _loads(line: Union[bytes, bytearray, str]) -> Any:
+        """
+        Parse a JSON line.
+        
+        Args:
+            line: JSON line
+            
+        Returns:
+            Parsed value, or None if the line is not valid JSON
+        """
+        try:
+            return loads(line)
+        except ValueError:
+            return None
+    
+    def _parse_lines(self, lines: List[Union[bytes, bytearray, str]]) -> List[LogEvent]:
+        """
+        Parse a list of Winlogbeat JSON lines into LogEvents.
+        
+        Each step runs as a single pass over the whole list, so a chunk of
+        lines is parsed, filtered and converted without per-line overhead.
+        
+        Args:
+            lines: JSON lines
+            
+        Returns:
+            LogEvents for the lines that are valid and pass the filters
+        """
+        parsed = [self._loads(line) for line in lines if line.strip()]
+        entries = [
+            (data, data["winlog"])
+            for data in parsed
+            if isinstance(data, dict) and data.get("winlog") is not None
+        ]
+        return [
+            self._create_event(data, winlog)
+            for data, winlog in entries
+            if self._apply_filters(winlog)
+        ]
+    
+    def _parse_line(self, line: Union[bytes, bytearray, str]) -> Optional[LogEvent]:
+        """
+        Parse a Winlogbeat JSON line into a LogEvent.
+        
+        Args:
+            line: JSON line
+            
+        Returns:
+            LogEvent, or None if the line is empty, invalid or filtered out
+        """
+        # Skip empty lines
+        if not line.strip():
+            return None
+        
+        # Parse the line as JSON, skipping invalid JSON
+        data = self._loads(line)
+        if not isinstance(data, dict):
+            return None
+        
+        # Check if it's a Windows Event Log entry
+        winlog = data.get("winlog")
+        if winlog is None:
+            return None
+        
+        # Apply filters
+        if not self._apply_filters(winlog):
+            return None
+        
+        return self._create_event(data, winlog)
+    
+    async def _sleep(self, delay: float) -> None:
+        """
+        Sleep for up to ``delay`` seconds, returning early once the source is stopped.
+        
+        Args:
+            delay: Time to sleep in seconds
+        """
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
     
-    async def _read_file(self, path: str, position: int = 0) -> AsyncIterator[LogEvent]:
+    async def _read_file(self, path: str, position: int = 0) -> AsyncIterator[List[LogEvent]]:
         """
         Read events from a file.
         
+        The file is read in binary chunks of ``read_buffer_size`` bytes and
+        split into lines, carrying partial lines over to the next chunk.
+        
         Args:
             path: Path to the file
             position: Position to start reading from
             
         Yields:
-            LogEvent objects
+            Lists of up to ``batch_size`` LogEvent objects
         """
         try:
             # Open the file and seek to the position
-            async with open(path, "r") as f:
+            async with aiofiles.open(path, "rb") as f:
                 await f.seek(position)
+                buffer = bytearray()
                 
-                # Read lines
-                while True:
-                    line = await f.readline()
+                # Read chunks
+                while self.running:
+                    chunk = await f.read(self.read_buffer_size)
                     
                     # If we reached the end of the file
-                    if not line:
+                    if not chunk:
                         if self.tail:
                             # Wait before checking for new data
-                            await asyncio.sleep(self.poll_interval)
+                            await self._sleep(self.poll_interval)
                             continue
-                        else:
-                            break
+                        
+                        # Process a last line without a trailing newline
+                        event = self._parse_line(buffer)
+                        if event:
+                            yield [event]
+                        break
                     
-                    # Skip empty lines
-                    if not line.strip():
+                    buffer += chunk
+                    end = buffer.rfind(b"\n")
+                    if end < 0:
                         continue
                     
-                    # Parse the line as JSON
-                    try:
-                        data = json.loads(line)
-                        
-                        # Check if it's a Windows Event Log entry
-                        if "winlog" in data:
-                            # Apply filters
-                            if self._apply_filters(data):
-                                # Create and yield a log event
-                                event = self._create_event(data)
-                                yield event
-                    except json.JSONDecodeError:
-                        # Skip invalid JSON
-                        continue
+                    lines = buffer[:end].split(b"\n")
+                    del buffer[:end + 1]
+                    
+                    # Parse the whole chunk at once
+                    events = self._parse_lines(lines)
+                    for start in range(0, len(events), self.batch_size):
+                        yield events[start:start + self.batch_size]
         
         except Exception as e:
             # Log the error and continue
-            print(f"Error reading file {path}: {str(e)}")
+            logger.warning(f"Error reading file {path}: {str(e)}", exc_info=True)
     
-    async def _scan_directory(self) -> AsyncIterator[LogEvent]:
+    async def _scan_directory(self) -> AsyncIterator[List[LogEvent]]:
         """
         Scan a directory for Winlogbeat output files.
         
         Yields:
-            LogEvent objects
+            Lists of LogEvent objects
         """
         while self.running:
             try:
-                # Get all files in the directory
-                files = [os.path.join(self.path, f) for f in os.listdir(self.path) if os.path.isfile(os.path.join(self.path, f))]
+                # Get the unprocessed files in the directory, using the file
+                # type cached on each directory entry
+                with os.scandir(self.path) as it:
+                    entries = [
+                        entry for entry in it
+                        if entry.path not in self.processed_files and entry.is_file()
+                    ]
                 
                 # Sort files by modification time (oldest first)
-                files.sort(key=lambda f: os.path.getmtime(f))
+                entries.sort(key=lambda entry: entry.stat().st_mtime)
                 
                 # Process each file
-                for file_path in files:
-                    if file_path not in self.processed_files:
-                        # Process the file
-                        async for event in self._read_file(file_path):
-                            yield event
-                        
-                        # Mark the file as processed
-                        self.processed_files.add(file_path)
+                for entry in entries:
+                    async for batch in self._read_file(entry.path):
+                        yield batch
+                    
+                    # Leave a file that was cut short by a stop unprocessed
+                    if not self.running:
+                        break
+                    
+                    # Mark the file as processed
+                    self.processed_files.add(entry.path)
                 
                 # Wait before scanning again
-                await asyncio.sleep(self.poll_interval)
+                await self._sleep(self.poll_interval)
             
             except Exception as e:
                 # Log the error and continue
-                print(f"Error scanning directory {self.path}: {str(e)}")
-                await asyncio.sleep(self.poll_interval)
+                logger.warning(f"Error scanning directory {self.path}: {str(e)}", exc_info=True)
+                await self._sleep(self.error_backoff * (0.5 + random.random()))
     
-    async def _start_tcp_server(self) -> AsyncIterator[LogEvent]:
+    async def _start_tcp_server(self) -> AsyncIterator[List[LogEvent]]:
         """
         Start a TCP server to receive Winlogbeat events.
         
+        Client handlers push parsed events onto a bounded queue, which
+        applies back-pressure to clients when the pipeline falls behind.
+        
         Yields:
-            LogEvent objects
+            Lists of up to ``batch_size`` LogEvent objects
         """
+        self._event_queue = asyncio.Queue(maxsize=self.queue_size)
+        
         # Create a server
         server = await asyncio.start_server(
             self._handle_client, self.host, self.port
         )
         
         # Start the server
-        async with server:
-            await server.serve_forever()
+        serve_task = asyncio.create_task(server.serve_forever())
+        
+        try:
+            while self.running:
+                try:
+                    event = await asyncio.wait_for(
+                        self._event_queue.get(), timeout=self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    # Re-check whether the source is still running
+                    continue
+                
+                # Take whatever else is already queued without waiting
+                batch = [event]
+                while len(batch) < self.batch_size and not self._event_queue.empty():
+                    batch.append(self._event_queue.get_nowait())
+                
+                yield batch
+        
+        finally:
+            # Stop the server
+            serve_task.cancel()
+            server.close()
+            await server.wait_closed()
     
-    async def _handle_client(self, reader, writer):
+    async def _handle_client(self, reader, writer) -> None:
         """
         Handle a client connection.
         
@@ -192,55 +374,54 @@ class WinlogSource(Source):
             writer: StreamWriter
         """
         try:
+            buffer = bytearray()
+            
             # Read data
             while self.running:
-                # Read a line
-                line = await reader.readline()
+                # Read a chunk
+                chunk = await reader.read(self.read_buffer_size)
                 
                 # If the client closed the connection
-                if not line:
+                if not chunk:
+                    # Process a last line without a trailing newline
+                    event = self._parse_line(buffer)
+                    if event:
+                        await self._event_queue.put(event)
                     break
                 
-                # Parse the line as JSON
-                try:
-                    data = json.loads(line)
-                    
-                    # Check if it's a Windows Event Log entry
-                    if "winlog" in data:
-                        # Apply filters
-                        if self._apply_filters(data):
-                            # Create a log event
-                            event = self._create_event(data)
-                            
-                            # Yield the event
-                            yield event
-                except json.JSONDecodeError:
-                    # Skip invalid JSON
+                buffer += chunk
+                end = buffer.rfind(b"\n")
+                if end < 0:
                     continue
+                
+                lines = buffer[:end].split(b"\n")
+                del buffer[:end + 1]
+                
+                # Parse the complete lines and hand the events to the reader
+                for event in self._parse_lines(lines):
+                    await self._event_queue.put(event)
         
         except Exception as e:
             # Log the error
-            print(f"Error handling client: {str(e)}")
+            logger.warning(f"Error handling client: {str(e)}", exc_info=True)
         
         finally:
             # Close the connection
             writer.close()
             await writer.wait_closed()
     
-    def _apply_filters(self, data: Dict[str, Any]) -> bool:
+    def _apply_filters(self, winlog: Dict[str, Any]) -> bool:
         """
         Apply filters to a Windows Event Log entry.
         
         Args:
-            data: Windows Event Log entry
+            winlog: The "winlog" section of a Windows Event Log entry
             
         Returns:
             True if the entry passes the filters, False otherwise
         """
-        winlog = data.get("winlog", {})
-        
         # Filter by channel
-        if self.channels and winlog.get("channel") not in self.channels:
+        if self._channels_set and winlog.get("channel") not in self._channels_set:
             return False
         
         # Filter by level
@@ -260,7 +441,7 @@ class WinlogSource(Source):
                 return False
         
         # Filter by event ID
-        if self.event_ids:
+        if self._event_ids_set:
             event_id = winlog.get("event_id")
             if event_id is None:
                 return False
@@ -272,98 +453,105 @@ class WinlogSource(Source):
                 return False
             
             # Check event ID
-            if event_id not in self.event_ids:
+            if event_id not in self._event_ids_set:
                 return False
         
         # Filter by provider
-        if self.providers:
-            provider = winlog.get("provider", {}).get("name")
+        if self._providers_set:
+            provider_info = winlog.get("provider")
+            provider = provider_info.get("name") if provider_info else None
             if provider is None:
                 return False
             
             # Check provider
-            if provider not in self.providers:
+            if provider not in self._providers_set:
                 return False
         
         return True
     
-    def _create_event(self, data: Dict[str, Any]) -> LogEvent:
+    def _create_event(self, data: Dict[str, Any], winlog: Dict[str, Any]) -> LogEvent:
         """
         Create a LogEvent from a Windows Event Log entry.
         
         Args:
             data: Windows Event Log entry
+            winlog: The "winlog" section of the entry
             
         Returns:
             LogEvent
         """
-        winlog = data.get("winlog", {})
+        channel = winlog.get("channel")
+        provider_info = winlog.get("provider")
+        provider = provider_info.get("name") if provider_info else None
         
-        # Get timestamp
+        # Get timestamp, either an ISO 8601 string or epoch milliseconds
         timestamp = None
-        if "@timestamp" in data:
-            try:
-                timestamp = datetime.fromisoformat(data["@timestamp"].replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                pass
+        raw_timestamp = data.get("@timestamp")
+        if isinstance(raw_timestamp, str):
+            timestamp = _parse_iso_timestamp(raw_timestamp)
+        elif isinstance(raw_timestamp, (int, float)) and not isinstance(raw_timestamp, bool):
+            timestamp = datetime.fromtimestamp(raw_timestamp / 1000, timezone.utc)
+        
+        fields = {
+            "event_id": winlog.get("event_id"),
+            "level": winlog.get("level"),
+            "provider": provider,
+            "computer_name": winlog.get("computer_name"),
+            "record_id": winlog.get("record_id"),
+            "task": winlog.get("task"),
+            "keywords": winlog.get("keywords"),
+            "message": data.get("message"),
+            "host": data.get("host", {})
+        }
+        
+        # Add event data
+        if "event_data" in winlog:
+            fields["event_data"] = winlog["event_data"]
+        
+        # Add user data
+        if "user" in winlog:
+            fields["user"] = winlog["user"]
         
         # Create the event
         event = LogEvent(
-            raw_data=json.dumps(data),
+            raw_data=dumps(data),
             source_type="winlog",
-            source_name=winlog.get("channel", "unknown"),
-            timestamp=timestamp or datetime.utcnow(),
-            fields={
-                "event_id": winlog.get("event_id"),
-                "level": winlog.get("level"),
-                "provider": winlog.get("provider", {}).get("name"),
-                "computer_name": winlog.get("computer_name"),
-                "record_id": winlog.get("record_id"),
-                "task": winlog.get("task"),
-                "keywords": winlog.get("keywords"),
-                "message": data.get("message"),
-                "host": data.get("host", {})
-            },
+            source_name=channel if channel is not None else "unknown",
+            timestamp=timestamp,
+            fields=fields,
             metadata={
                 "winlog_source": self.mode,
-                "winlog_channel": winlog.get("channel")
+                "winlog_channel": channel
             }
         )
         
-        # Add event data
-        if "event_data" in winlog:
-            event.add_field("event_data", winlog["event_data"])
-        
-        # Add user data
-        if "user" in winlog:
-            event.add_field("user", winlog["user"])
-        
         return event
     
-    async def read(self) -> AsyncIterator[LogEvent]:
+    async def read(self) -> AsyncIterator[List[LogEvent]]:
         """
         Read log events from Windows Event Logs.
         
         Yields:
-            LogEvent objects
+            Lists of LogEvent objects
         """
         self.running = True
+        self._stopped = asyncio.Event()
         
         try:
             if self.mode == "file":
                 # Read from a single file
-                async for event in self._read_file(self.path):
-                    yield event
+                async for batch in self._read_file(self.path):
+                    yield batch
             
             elif self.mode == "directory":
                 # Scan a directory for files
-                async for event in self._scan_directory():
-                    yield event
+                async for batch in self._scan_directory():
+                    yield batch
             
             elif self.mode == "tcp":
                 # Start a TCP server
-                async for event in self._start_tcp_server():
-                    yield event
+                async for batch in self._start_tcp_server():
+                    yield batch
         
         except asyncio.CancelledError:
             # Handle cancellation
@@ -371,11 +559,19 @@ class WinlogSource(Source):
         
         except Exception as e:
             # Log the error
-            print(f"Error reading Windows Event Logs: {str(e)}")
+            logger.warning(f"Error reading Windows Event Logs: {str(e)}", exc_info=True)
         
         finally:
             self.running = False
     
+    async def stop(self) -> None:
+        """
+        Signal the source to stop reading, waking it from any poll sleep.
+        """
+        self.running = False
+        if self._stopped:
+            self._stopped.set()
+    
     async def shutdown(self) -> None:
         """
         Perform cleanup and release resources.
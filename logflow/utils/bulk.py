@@ -0,0 +1,102 @@
+"""
+Bulk action helpers shared by the Elasticsearch and OpenSearch sinks.
+"""
+import re
+from typing import Any, Dict, List
+
+from logflow.core.models import LogEvent, ns_to_datetime
+
+
+# Maximum number of hour buckets kept in an index name cache
+MAX_INDEX_CACHE_SIZE = 1024
+
+NS_PER_HOUR = 3_600_000_000_000
+
+# Placeholders of an index template and the date tokens inside them
+_PLACEHOLDER = re.compile(r"\{([^{}]*)\}")
+_DATE_TOKEN = re.compile(r"yyyy|MM|dd|HH")
+
+
+def format_index(
+    index_template: str,
+    timestamp_ns: int,
+    cache: Dict[int, str]
+) -> str:
+    """
+    Format an index name for a timestamp, caching the result per hour bucket.
+
+    Index templates only reference the year, month, day and hour, so every
+    event in the same hour maps to the same index name. The ``yyyy``, ``MM``,
+    ``dd`` and ``HH`` tokens are replaced inside each placeholder, so a
+    placeholder may hold several of them (e.g. "{yyyy.MM.dd}").
+
+    Args:
+        index_template: Index pattern (e.g. "logs-{yyyy.MM.dd}")
+        timestamp_ns: Timestamp in nanoseconds since the epoch (UTC)
+        cache: Cache of formatted index names keyed by hour bucket
+
+    Returns:
+        Formatted index name
+    """
+    bucket = timestamp_ns // NS_PER_HOUR
+    index = cache.get(bucket)
+
+    if index is None:
+        if len(cache) >= MAX_INDEX_CACHE_SIZE:
+            cache.clear()
+
+        timestamp = ns_to_datetime(bucket * NS_PER_HOUR)
+        tokens = {
+            "yyyy": f"{timestamp.year:04d}",
+            "MM": f"{timestamp.month:02d}",
+            "dd": f"{timestamp.day:02d}",
+            "HH": f"{timestamp.hour:02d}"
+        }
+        index = _PLACEHOLDER.sub(
+            lambda placeholder: _DATE_TOKEN.sub(
+                lambda token: tokens[token.group()], placeholder.group(1)
+            ),
+            index_template
+        )
+        cache[bucket] = index
+
+    return index
+
+
+def build_actions(
+    events: List[LogEvent],
+    index_template: str,
+    cache: Dict[int, str],
+    include_id: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Convert a batch of log events to bulk index actions.
+
+    Args:
+        events: Log events to convert
+        index_template: Index pattern (e.g. "logs-{yyyy.MM.dd}")
+        cache: Cache of formatted index names keyed by hour bucket
+        include_id: Whether to use the event ID as the document ID. When
+            False, the cluster generates IDs and skips the per-document
+            version lookup.
+
+    Returns:
+        List of bulk actions
+    """
+    if include_id:
+        return [
+            {
+                "_index": format_index(index_template, event.timestamp_ns, cache),
+                "_id": event.id,
+                "_source": event.to_dict()
+            }
+            for event in events
+        ]
+
+    return [
+        {
+            "_index": format_index(index_template, event.timestamp_ns, cache),
+            "_source": event.to_dict()
+        }
+        for event in events
+    ]
@@ -0,0 +1,60 @@
+"""
+JSON serialization helpers for LogFlow.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Decoding errors raise ``json.JSONDecodeError`` in both cases.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# Whether the orjson backend is in use
+HAS_ORJSON = orjson is not None
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> str:
+        """
+        Serialize an object to a JSON string.
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            JSON string
+        """
+        return orjson.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """
+        Serialize an object to UTF-8 encoded JSON.
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            JSON bytes
+        """
+        return orjson.dumps(obj)
+else:
+    loads = json.loads
+    dumps = json.dumps
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """
+        Serialize an object to UTF-8 encoded JSON.
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            JSON bytes
+        """
+        return json.dumps(obj).encode("utf-8")
@@ -2,73 +2,230 @@
 Web server for LogFlow.
 """
 import asyncio
+import importlib.util
 import logging
-import os
 import time
-from typing import Dict, List, Any, Optional
+import zlib
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 import uvicorn
-from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from logflow.core.engine import Engine
+from logflow.utils.serialization import HAS_ORJSON, dumps_bytes
+
+
+# JSON response class, backed by orjson when it is installed
+FastJSONResponse = ORJSONResponse if HAS_ORJSON else JSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the WebSocket update producer and stop the engine on shutdown."""
+    logger.info("Starting LogFlow web server")
+    producer = asyncio.create_task(_produce_updates())
+    
+    try:
+        yield
+    finally:
+        logger.info("Stopping LogFlow web server")
+        producer.cancel()
+        await engine.stop()
 
 
 # Create the FastAPI app
 app = FastAPI(
     title="LogFlow Dashboard",
     description="Web interface for monitoring LogFlow pipelines",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
+# Compress larger responses, such as metrics for many pipelines
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=4)
+
 # Create the engine
 engine = Engine()
 
 # Set up logging
 logger = logging.getLogger("logflow.web")
 
-# Set up templates
-templates_dir = os.path.join(os.path.dirname(__file__), "templates")
-templates = Jinja2Templates(directory=templates_dir)
+# Package directories
+WEB_DIR = Path(__file__).parent
+TEMPLATES_DIR = WEB_DIR / "templates"
+STATIC_DIR = WEB_DIR / "static"
+
+# Set up templates; they ship with the package, so skip the per-render
+# modification check
+templates = Jinja2Templates(directory=TEMPLATES_DIR, auto_reload=False)
 
 # Set up static files
-static_dir = os.path.join(os.path.dirname(__file__), "static")
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+
+# Maximum number of messages queued for a WebSocket before the oldest is dropped
+SEND_QUEUE_SIZE = 64
+
+# Size in bytes above which WebSocket messages are sent zlib-compressed
+COMPRESSION_THRESHOLD = 1024
+
+
+def _encode_message(message: Dict[str, Any]) -> Union[str, bytes]:
+    """
+    Encode a WebSocket message.
+    
+    Large messages are compressed once here and sent as binary frames, so
+    a broadcast does not compress the same payload for every connection.
+    
+    Args:
+        message: Message to encode
+        
+    Returns:
+        JSON text, or zlib-compressed JSON bytes for large messages
+    """
+    data = dumps_bytes(message)
+    if len(data) > COMPRESSION_THRESHOLD:
+        return zlib.compress(data, 1)
+    return data.decode("utf-8")
+
 
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # Send queue and writer task of each connection
+        self.active_connections: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        
+        # Give each connection its own queue and writer, so a slow client
+        # only backs up its own messages
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        writer = asyncio.create_task(self._write_messages(websocket, queue))
+        self.active_connections[websocket] = (queue, writer)
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        sender = self.active_connections.pop(websocket, None)
+        if sender is not None and sender[1] is not asyncio.current_task():
+            sender[1].cancel()
+    
+    async def _write_messages(self, websocket: WebSocket, queue: asyncio.Queue):
+        try:
+            while True:
+                payload = await queue.get()
+                if isinstance(payload, bytes):
+                    await websocket.send_bytes(payload)
+                else:
+                    await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The client went away
+            self.disconnect(websocket)
+    
+    def _enqueue(self, queue: asyncio.Queue, payload: Union[str, bytes]):
+        if queue.full():
+            # Drop the oldest message for clients that are falling behind
+            queue.get_nowait()
+        queue.put_nowait(payload)
+    
+    async def send(self, websocket: WebSocket, message: Dict[str, Any]):
+        sender = self.active_connections.get(websocket)
+        if sender is not None:
+            self._enqueue(sender[0], _encode_message(message))
     
     async def broadcast(self, message: Dict[str, Any]):
-        for connection in self.active_connections:
-            await connection.send_json(message)
+        # Encode once and queue the message for every connection; queueing
+        # never awaits, so the connections cannot change during the loop
+        payload = _encode_message(message)
+        
+        for queue, _ in self.active_connections.values():
+            self._enqueue(queue, payload)
 
 
 # Create connection manager
 manager = ConnectionManager()
 
+# Interval in seconds between pipeline status updates sent over WebSockets
+UPDATE_INTERVAL = 5.0
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the engine on startup."""
-    logger.info("Starting LogFlow web server")
+# Maximum age in seconds of the cached pipeline status snapshot
+SNAPSHOT_TTL = 0.5
 
+# Cached pipeline status snapshot and the time it was taken
+_snapshot_cache: Tuple[float, Optional[List[Dict[str, Any]]]] = (0.0, None)
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Stop the engine on shutdown."""
-    logger.info("Stopping LogFlow web server")
-    await engine.stop()
+
+def _collect_snapshot() -> List[Dict[str, Any]]:
+    """
+    Collect the status of all pipelines from the engine.
+    
+    Returns:
+        List of pipeline statuses
+    """
+    snapshot = []
+    for name in engine.get_pipeline_names():
+        try:
+            snapshot.append(engine.get_pipeline_status(name))
+        except Exception as e:
+            logger.error(f"Error getting status for pipeline {name}: {str(e)}")
+    
+    return snapshot
+
+
+async def _get_snapshot() -> List[Dict[str, Any]]:
+    """
+    Get the status of all pipelines.
+    
+    The snapshot is shared by all requests and WebSocket updates for up
+    to SNAPSHOT_TTL seconds. It is collected on the event loop, so the
+    pipelines cannot change while it is being read.
+    
+    Returns:
+        List of pipeline statuses
+    """
+    global _snapshot_cache
+    
+    taken_at, snapshot = _snapshot_cache
+    now = time.monotonic()
+    if snapshot is not None and now - taken_at < SNAPSHOT_TTL:
+        return snapshot
+    
+    snapshot = _collect_snapshot()
+    _snapshot_cache = (now, snapshot)
+    return snapshot
+
+
+def _clear_snapshot() -> None:
+    """Discard the cached pipeline status snapshot."""
+    global _snapshot_cache
+    _snapshot_cache = (0.0, None)
+
+
+async def _produce_updates():
+    """Broadcast the pipeline status to all WebSocket clients periodically."""
+    loop = asyncio.get_running_loop()
+    next_update = loop.time()
+    
+    while True:
+        # Schedule against a fixed cadence so the time spent broadcasting
+        # does not delay the following updates
+        next_update += UPDATE_INTERVAL
+        await asyncio.sleep(max(next_update - loop.time(), 0))
+        
+        # Keep the producer running after an error, so clients keep
+        # getting updates
+        try:
+            if manager.active_connections:
+                await manager.broadcast({"type": "pipelines", "data": await _get_snapshot()})
+        except Exception:
+            logger.exception("Error broadcasting pipeline status")
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -77,29 +234,19 @@ async def get_dashboard(request: Request):
     return templates.TemplateResponse("dashboard.html", {"request": request})
 
 
-@app.get("/api/pipelines")
+@app.get("/api/pipelines", response_model=None)
 async def get_pipelines():
     """Get all pipelines."""
-    pipeline_names = engine.get_pipeline_names()
-    pipelines = []
-    
-    for name in pipeline_names:
-        try:
-            status = engine.get_pipeline_status(name)
-            pipelines.append(status)
-        except Exception as e:
-            logger.error(f"Error getting status for pipeline {name}: {str(e)}")
-    
-    return {"pipelines": pipelines}
+    return FastJSONResponse({"pipelines": await _get_snapshot()})
 
 
-@app.get("/api/pipelines/{name}")
+@app.get("/api/pipelines/{name}", response_model=None)
 async def get_pipeline(name: str):
     """Get pipeline status."""
     try:
-        return engine.get_pipeline_status(name)
+        return FastJSONResponse(engine.get_pipeline_status(name))
     except KeyError:
-        return {"error": f"Pipeline not found: {name}"}
+        return FastJSONResponse({"error": f"Pipeline not found: {name}"})
 
 
 @app.post("/api/pipelines/{name}/start")
@@ -107,6 +254,7 @@ async def start_pipeline(name: str):
     """Start a pipeline."""
     try:
         await engine.start_pipeline(name)
+        _clear_snapshot()
         return {"status": "started", "name": name}
     except KeyError:
         return {"error": f"Pipeline not found: {name}"}
@@ -119,6 +267,7 @@ async def stop_pipeline(name: str):
     """Stop a pipeline."""
     try:
         await engine.stop_pipeline(name)
+        _clear_snapshot()
         return {"status": "stopped", "name": name}
     except KeyError:
         return {"error": f"Pipeline not found: {name}"}
@@ -126,28 +275,23 @@ async def stop_pipeline(name: str):
         return {"error": str(e)}
 
 
-@app.get("/api/metrics")
+@app.get("/api/metrics", response_model=None)
 async def get_metrics():
     """Get system metrics."""
-    metrics = {
-        "pipelines": len(engine.get_pipeline_names()),
-        "pipeline_metrics": {}
-    }
+    snapshot = await _get_snapshot()
     
-    # Add metrics for each pipeline
-    for name in engine.get_pipeline_names():
-        try:
-            status = engine.get_pipeline_status(name)
-            metrics["pipeline_metrics"][name] = {
+    return FastJSONResponse({
+        "pipelines": len(engine.get_pipeline_names()),
+        "pipeline_metrics": {
+            status["name"]: {
                 "events_processed": status["events_processed"],
                 "events_dropped": status["events_dropped"],
                 "processing_errors": status["processing_errors"],
                 "uptime": status["uptime"] if status["running"] else 0
             }
-        except Exception:
-            pass
-    
-    return metrics
+            for status in snapshot
+        }
+    })
 
 
 @app.websocket("/ws")
@@ -156,39 +300,17 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     
     try:
-        # Send initial data
-        pipeline_names = engine.get_pipeline_names()
-        pipelines = []
+        # Send initial data; later updates are broadcast by the producer task
+        await manager.send(websocket, {"type": "pipelines", "data": await _get_snapshot()})
         
-        for name in pipeline_names:
-            try:
-                status = engine.get_pipeline_status(name)
-                pipelines.append(status)
-            except Exception:
-                pass
-        
-        await websocket.send_json({"type": "pipelines", "data": pipelines})
-        
-        # Keep the connection alive and send updates
+        # Keep the connection open until the client disconnects, ignoring
+        # anything the client sends
         while True:
-            # Wait for a message (or timeout)
-            try:
-                await asyncio.wait_for(websocket.receive_text(), timeout=5.0)
-            except asyncio.TimeoutError:
-                # Send updates periodically
-                pipeline_names = engine.get_pipeline_names()
-                pipelines = []
-                
-                for name in pipeline_names:
-                    try:
-                        status = engine.get_pipeline_status(name)
-                        pipelines.append(status)
-                    except Exception:
-                        pass
-                
-                await websocket.send_json({"type": "pipelines", "data": pipelines})
-    
-    except WebSocketDisconnect:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    
+    finally:
         manager.disconnect(websocket)
 
 
@@ -201,10 +323,20 @@ def start_web_server(host: str = "0.0.0.0", port: int = 8080, reload: bool = Fal
         port: Port to bind to
         reload: Whether to enable auto-reload
     """
+    # Use the uvloop event loop and the httptools parser when they are installed
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    ws = "websockets" if importlib.util.find_spec("websockets") else "auto"
+    
     uvicorn.run(
         "logflow.web.server:app",
         host=host,
         port=port,
         reload=reload,
-        log_level="info"
+        log_level="info",
+        loop=loop,
+        http=http,
+        ws=ws,
+        # Large messages are already compressed once per broadcast
+        ws_per_message_deflate=False
     )
\ No newline at end of file
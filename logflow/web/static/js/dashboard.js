@@ -17,9 +17,15 @@ document.addEventListener('DOMContentLoaded', function() {
             reconnectAttempts = 0;
         };
         
+        // Messages are decoded one after another, so a compressed message
+        // is never applied after a newer plain one
+        ws.pending = Promise.resolve();
+        
         ws.onmessage = function(event) {
-            const data = JSON.parse(event.data);
-            handleWebSocketMessage(data);
+            this.pending = this.pending
+                .then(() => decodeWebSocketMessage(event))
+                .then(handleWebSocketMessage)
+                .catch(error => console.error('WebSocket message error:', error));
         };
         
         ws.onclose = function() {
@@ -37,6 +43,18 @@ document.addEventListener('DOMContentLoaded', function() {
         };
     }
     
+    // Decode a WebSocket message
+    async function decodeWebSocketMessage(event) {
+        // Large messages arrive as zlib-compressed binary frames
+        let text = event.data;
+        if (typeof text !== 'string') {
+            const stream = text.stream().pipeThrough(new DecompressionStream('deflate'));
+            text = await new Response(stream).text();
+        }
+        
+        return JSON.parse(text);
+    }
+    
     // Handle WebSocket messages
     function handleWebSocketMessage(data) {
         if (data.type === 'pipelines') {
@@ -1,14 +1,82 @@
 """
 Pytest configuration for LogFlow tests.
 """
+import asyncio
+import itertools
 import os
+import shutil
 import sys
+import tempfile
+from pathlib import Path
+
 import pytest
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-# Configure pytest
+# Configure pytest; pytest-asyncio-cooperative is not used because it breaks
+# the tmp_path fixtures the file-based tests rely on
 pytest_plugins = [
     "pytest_asyncio",
-]
\ No newline at end of file
+]
+
+
+# In-memory filesystem for test files, available on most Linux systems
+SHM_DIR = "/dev/shm"
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Create an event loop shared by all async tests."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def tmp_root(tmp_path_factory):
+    """Create a temporary directory shared by all tests."""
+    # Keep test files in memory when tmpfs is available, so file writes and
+    # closes don't wait on the disk
+    if sys.platform.startswith("linux") and os.path.isdir(SHM_DIR):
+        path = Path(tempfile.mkdtemp(prefix="logflow-tests-", dir=SHM_DIR))
+        yield path
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp("logflow")
+
+
+@pytest.fixture(scope="session")
+def make_event(next_id):
+    """
+    Create a factory for test log events.
+    
+    Events are built with the LogEvent constructor; only the model tests
+    should go through the to_dict/from_dict codec.
+    """
+    from logflow.core.models import LogEvent
+    
+    def make_event(fields=None, raw_data="test log message", **kwargs):
+        if "event_id" not in kwargs:
+            kwargs["event_id"] = next_id()
+        
+        return LogEvent(
+            raw_data=raw_data,
+            source_type="test",
+            source_name="test_source",
+            fields=dict(fields) if fields else None,
+            **kwargs
+        )
+    
+    return make_event
+
+
+@pytest.fixture(scope="session")
+def next_id():
+    """Create a generator of unique test event IDs."""
+    counter = itertools.count()
+    
+    def next_id():
+        return f"test-id-{next(counter)}"
+    
+    return next_id
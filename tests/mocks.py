@@ -0,0 +1,128 @@
+"""
+Mock pipeline components for LogFlow tests.
+"""
+import asyncio
+
+from logflow.sources.base import Source
+from logflow.processors.base import Processor
+from logflow.sinks.base import Sink
+
+
+class EventReplay:
+    """Async iterator that replays a list of events."""
+    
+    def __init__(self, events):
+        self.events = iter(events)
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        try:
+            return next(self.events)
+        except StopIteration:
+            raise StopAsyncIteration from None
+    
+    async def aclose(self):
+        pass
+
+
+class MockSource(Source):
+    """Mock source for testing."""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clear the state recorded by earlier tests."""
+        self.initialize_called = False
+        self.shutdown_called = False
+        self.events = []
+    
+    async def initialize(self, config):
+        self.initialize_called = True
+        self.config = config
+    
+    def read(self):
+        return EventReplay(self.events)
+    
+    async def shutdown(self):
+        self.shutdown_called = True
+
+
+class EndlessSource(MockSource):
+    """Mock source that replays its events, then waits until it is stopped."""
+    
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+        self.stopped = asyncio.Event()
+        self.reading = False
+        self.shutdown_while_reading = False
+    
+    async def read(self):
+        self.reading = True
+        try:
+            for event in self.events:
+                yield event
+            
+            await self.stopped.wait()
+        finally:
+            self.reading = False
+    
+    async def stop(self):
+        self.stopped.set()
+    
+    async def shutdown(self):
+        await super().shutdown()
+        self.shutdown_while_reading = self.reading
+
+
+class MockProcessor(Processor):
+    """Mock processor for testing."""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clear the state recorded by earlier tests."""
+        self.initialize_called = False
+        self.shutdown_called = False
+        self.processed_events = []
+        self.drop_events = False
+    
+    async def initialize(self, config):
+        self.initialize_called = True
+        self.config = config
+    
+    async def process(self, event):
+        self.processed_events.append(event)
+        if self.drop_events:
+            return None
+        return event
+    
+    async def shutdown(self):
+        self.shutdown_called = True
+
+
+class MockSink(Sink):
+    """Mock sink for testing."""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clear the state recorded by earlier tests."""
+        self.initialize_called = False
+        self.shutdown_called = False
+        self.written_events = []
+    
+    async def initialize(self, config):
+        self.initialize_called = True
+        self.config = config
+    
+    async def write(self, events):
+        self.written_events.extend(events)
+    
+    async def shutdown(self):
+        self.shutdown_called = True
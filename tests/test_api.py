@@ -12,10 +12,38 @@ from fastapi.testclient import TestClient
 from logflow.api.server import app, engine
 
 
-@pytest.fixture
+# Pipeline statuses returned by the mocked engine
+PIPELINE_STATUSES = {
+    "pipeline1": {
+        "name": "pipeline1",
+        "running": True,
+        "sources": 1,
+        "processors": 2,
+        "sinks": 1,
+        "events_processed": 100,
+        "events_dropped": 10,
+        "processing_errors": 5,
+        "uptime": 60
+    },
+    "pipeline2": {
+        "name": "pipeline2",
+        "running": False,
+        "sources": 2,
+        "processors": 1,
+        "sinks": 2,
+        "events_processed": 50,
+        "events_dropped": 5,
+        "processing_errors": 2,
+        "uptime": 0
+    }
+}
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client."""
-    return TestClient(app)
+    """Create a test client shared by all tests."""
+    with TestClient(app) as client:
+        yield client
 
 
 def test_list_pipelines(client):
@@ -237,30 +265,7 @@ def test_get_metrics(client):
     """Test getting metrics."""
     # Mock the engine
     engine.get_pipeline_names = MagicMock(return_value=["pipeline1", "pipeline2"])
-    engine.get_pipeline_status = MagicMock(side_effect=lambda name: {
-        "pipeline1": {
-            "name": "pipeline1",
-            "running": True,
-            "sources": 1,
-            "processors": 2,
-            "sinks": 1,
-            "events_processed": 100,
-            "events_dropped": 10,
-            "processing_errors": 5,
-            "uptime": 60
-        },
-        "pipeline2": {
-            "name": "pipeline2",
-            "running": False,
-            "sources": 2,
-            "processors": 1,
-            "sinks": 2,
-            "events_processed": 50,
-            "events_dropped": 5,
-            "processing_errors": 2,
-            "uptime": 0
-        }
-    }[name])
+    engine.get_pipeline_status = MagicMock(side_effect=PIPELINE_STATUSES.__getitem__)
     
     # Make the request
     response = client.get("/api/v1/metrics")
@@ -0,0 +1,64 @@
+"""
+Tests for the bulk action helpers.
+"""
+from datetime import datetime
+
+from logflow.core.models import LogEvent, datetime_to_ns
+from logflow.sinks.elasticsearch import ElasticsearchSink
+from logflow.utils.bulk import build_actions, format_index
+
+
+def test_format_index_caches_per_hour():
+    """Test that index names are cached per hour bucket."""
+    cache = {}
+    template = "logs-{yyyy}.{MM}.{dd}-{HH}"
+
+    index1 = format_index(template, datetime_to_ns(datetime(2023, 1, 2, 3, 4, 5)), cache)
+    index2 = format_index(template, datetime_to_ns(datetime(2023, 1, 2, 3, 59, 0)), cache)
+    index3 = format_index(template, datetime_to_ns(datetime(2023, 1, 2, 4, 0, 0)), cache)
+
+    assert index1 == "logs-2023.01.02-03"
+    assert index2 == "logs-2023.01.02-03"
+    assert index3 == "logs-2023.01.02-04"
+    assert len(cache) == 2
+
+
+def test_format_index_default_pattern():
+    """Test formatting the sinks' default index pattern."""
+    timestamp_ns = datetime_to_ns(datetime(2023, 1, 2, 3, 4, 5))
+
+    assert format_index(ElasticsearchSink().index, timestamp_ns, {}) == "logs-2023.01.02"
+
+
+def test_build_actions():
+    """Test converting events to bulk actions."""
+    event = LogEvent(
+        raw_data="test log message",
+        source_type="test",
+        source_name="test_source",
+        event_id="test-id",
+        timestamp=datetime(2023, 1, 1, 12, 0, 0)
+    )
+
+    actions = build_actions([event], "logs-{yyyy}.{MM}.{dd}", {})
+
+    assert len(actions) == 1
+    assert actions[0]["_index"] == "logs-2023.01.01"
+    assert actions[0]["_id"] == "test-id"
+    assert actions[0]["_source"]["raw_data"] == "test log message"
+
+
+def test_build_actions_without_id():
+    """Test converting events to bulk actions with auto-generated IDs."""
+    event = LogEvent(
+        raw_data="test log message",
+        source_type="test",
+        source_name="test_source",
+        event_id="test-id",
+        timestamp=datetime(2023, 1, 1, 12, 0, 0)
+    )
+
+    actions = build_actions([event], "logs-{yyyy}.{MM}.{dd}", {}, include_id=False)
+
+    assert "_id" not in actions[0]
+    assert actions[0]["_source"]["id"] == "test-id"
@@ -1,8 +1,6 @@
 """
 Tests for the CLI.
 """
-import os
-import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -11,11 +9,38 @@ from click.testing import CliRunner
 from logflow.cli.commands import cli
 
 
+# Pipeline statuses returned by the mocked engine
+PIPELINE_STATUSES = {
+    "pipeline1": {
+        "name": "pipeline1",
+        "running": True,
+        "sources": 1,
+        "processors": 2,
+        "sinks": 1,
+        "events_processed": 100,
+        "events_dropped": 10,
+        "processing_errors": 5,
+        "uptime": 60
+    },
+    "pipeline2": {
+        "name": "pipeline2",
+        "running": False,
+        "sources": 2,
+        "processors": 1,
+        "sinks": 2,
+        "events_processed": 50,
+        "events_dropped": 5,
+        "processing_errors": 2,
+        "uptime": 0
+    }
+}
+
+
 @pytest.fixture
-def temp_config_file():
+def temp_config_file(tmp_path):
     """Create a temporary configuration file."""
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".yaml", delete=False) as f:
-        f.write("""
+    path = tmp_path / "pipeline.yaml"
+    path.write_text("""
 name: test-pipeline
 sources:
   - name: test-source
@@ -28,12 +53,8 @@ sinks:
     config:
       path: /tmp/output.log
 """)
-        path = f.name
-    
-    yield path
     
-    # Clean up
-    os.unlink(path)
+    return str(path)
 
 
 def test_cli_start(temp_config_file):
@@ -69,30 +90,7 @@ def test_cli_status():
     # Mock the engine
     mock_engine = MagicMock()
     mock_engine.get_pipeline_names.return_value = ["pipeline1", "pipeline2"]
-    mock_engine.get_pipeline_status.side_effect = lambda name: {
-        "pipeline1": {
-            "name": "pipeline1",
-            "running": True,
-            "sources": 1,
-            "processors": 2,
-            "sinks": 1,
-            "events_processed": 100,
-            "events_dropped": 10,
-            "processing_errors": 5,
-            "uptime": 60
-        },
-        "pipeline2": {
-            "name": "pipeline2",
-            "running": False,
-            "sources": 2,
-            "processors": 1,
-            "sinks": 2,
-            "events_processed": 50,
-            "events_dropped": 5,
-            "processing_errors": 2,
-            "uptime": 0
-        }
-    }[name]
+    mock_engine.get_pipeline_status.side_effect = PIPELINE_STATUSES.__getitem__
     
     # Run the command
     with patch("logflow.cli.commands.Engine", return_value=mock_engine):
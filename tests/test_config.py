@@ -1,32 +1,24 @@
 """
 Tests for the configuration module.
 """
-import os
-import tempfile
-
 import pytest
 import yaml
 
-from logflow.core.config import load_config_file, validate_pipeline_config, ConfigError
+from logflow.core.config import load_config_file, validate_pipeline_config, ConfigError, SafeDumper
 
 
-def test_load_config_file():
+def test_load_config_file(tmp_path):
     """Test loading a configuration file."""
     # Create a temporary configuration file
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump({"name": "test", "sources": [], "sinks": []}, f)
-    
-    try:
-        # Load the configuration
-        config = load_config_file(f.name)
-        
-        assert config["name"] == "test"
-        assert config["sources"] == []
-        assert config["sinks"] == []
-    
-    finally:
-        # Clean up
-        os.unlink(f.name)
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump({"name": "test", "sources": [], "sinks": []}, Dumper=SafeDumper))
+    
+    # Load the configuration
+    config = load_config_file(str(path))
+    
+    assert config["name"] == "test"
+    assert config["sources"] == []
+    assert config["sinks"] == []
 
 
 def test_load_config_file_not_found():
@@ -35,20 +27,15 @@ def test_load_config_file_not_found():
         load_config_file("/nonexistent/file.yaml")
 
 
-def test_load_config_file_invalid_yaml():
+def test_load_config_file_invalid_yaml(tmp_path):
     """Test loading an invalid YAML file."""
     # Create a temporary file with invalid YAML
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write("invalid: yaml: content:")
-    
-    try:
-        # Try to load the configuration
-        with pytest.raises(ConfigError, match="Error parsing YAML"):
-            load_config_file(f.name)
+    path = tmp_path / "config.yaml"
+    path.write_text("invalid: yaml: content:")
     
-    finally:
-        # Clean up
-        os.unlink(f.name)
+    # Try to load the configuration
+    with pytest.raises(ConfigError, match="Error parsing YAML"):
+        load_config_file(str(path))
 
 
 def test_validate_pipeline_config():
@@ -1,63 +1,72 @@
 """
 Tests for the engine.
 """
-import os
-import tempfile
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-import yaml
 
 from logflow.core.engine import Engine
 from logflow.core.pipeline import Pipeline
 
 
-@pytest.fixture
-def temp_config_file():
-    """Create a temporary configuration file."""
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".yaml", delete=False) as f:
-        yaml.dump({
-            "name": "test-pipeline",
-            "sources": [
-                {
-                    "name": "test-source",
-                    "type": "FileSource",
-                    "config": {"path": "/tmp/test.log"}
-                }
-            ],
-            "sinks": [
-                {
-                    "name": "test-sink",
-                    "type": "FileSink",
-                    "config": {"path": "/tmp/output.log"}
-                }
-            ]
-        }, f)
-        path = f.name
-    
-    yield path
-    
-    # Clean up
-    os.unlink(path)
+class StubPipeline:
+    """Pipeline stand-in that records which methods were called."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.initialize_called = False
+        self.run_called = False
+        self.stop_called = False
+    
+    async def initialize(self):
+        self.initialize_called = True
+    
+    async def run(self):
+        self.run_called = True
+    
+    async def stop(self):
+        self.stop_called = True
+
+
+# Pipeline configuration returned in place of a loaded configuration file
+CONFIG = {
+    "name": "test-pipeline",
+    "sources": [
+        {
+            "name": "test-source",
+            "type": "FileSource",
+            "config": {"path": "/tmp/test.log"}
+        }
+    ],
+    "sinks": [
+        {
+            "name": "test-sink",
+            "type": "FileSink",
+            "config": {"path": "/tmp/output.log"}
+        }
+    ]
+}
 
 
 @pytest.mark.asyncio
-async def test_engine_load_pipeline(temp_config_file):
+async def test_engine_load_pipeline():
     """Test loading a pipeline."""
     engine = Engine()
     
-    # Mock the Pipeline class
-    with patch("logflow.core.engine.Pipeline") as mock_pipeline_class:
-        mock_pipeline = AsyncMock()
-        mock_pipeline.name = "test-pipeline"
+    # Mock the configuration file and the Pipeline class
+    with patch("logflow.core.engine.load_config_file", return_value=CONFIG), \
+            patch("logflow.core.engine.Pipeline") as mock_pipeline_class:
+        mock_pipeline = StubPipeline("test-pipeline")
         mock_pipeline_class.return_value = mock_pipeline
         
         # Load the pipeline
-        pipeline = await engine.load_pipeline(temp_config_file)
+        pipeline = await engine.load_pipeline("/nonexistent/config.yaml")
         
         # Check that the pipeline was created and initialized
         assert mock_pipeline_class.called
-        assert mock_pipeline.initialize.called
+        assert mock_pipeline.initialize_called
         assert pipeline == mock_pipeline
         assert engine.pipelines["test-pipeline"] == mock_pipeline
 
@@ -67,16 +76,16 @@ async def test_engine_start_pipeline():
     """Test starting a pipeline."""
     engine = Engine()
     
-    # Create a mock pipeline
-    mock_pipeline = AsyncMock()
-    mock_pipeline.name = "test-pipeline"
+    # Create a stub pipeline
+    mock_pipeline = StubPipeline("test-pipeline")
     engine.pipelines["test-pipeline"] = mock_pipeline
     
-    # Start the pipeline
+    # Start the pipeline and let its task run
     await engine.start_pipeline("test-pipeline")
+    await asyncio.sleep(0)
     
     # Check that the pipeline was started
-    assert mock_pipeline.run.called
+    assert mock_pipeline.run_called
 
 
 @pytest.mark.asyncio
@@ -84,20 +93,19 @@ async def test_engine_stop_pipeline():
     """Test stopping a pipeline."""
     engine = Engine()
     
-    # Create a mock pipeline
-    mock_pipeline = AsyncMock()
-    mock_pipeline.name = "test-pipeline"
+    # Create a stub pipeline
+    mock_pipeline = StubPipeline("test-pipeline")
     engine.pipelines["test-pipeline"] = mock_pipeline
     
     # Stop the pipeline
     await engine.stop_pipeline("test-pipeline")
     
     # Check that the pipeline was stopped
-    assert mock_pipeline.stop.called
+    assert mock_pipeline.stop_called
 
 
 @pytest.mark.asyncio
-async def test_engine_start(temp_config_file):
+async def test_engine_start():
     """Test starting the engine."""
     engine = Engine()
     
@@ -105,12 +113,10 @@ async def test_engine_start(temp_config_file):
     engine.load_pipeline = AsyncMock()
     engine.start_pipeline = AsyncMock()
     
-    mock_pipeline = AsyncMock()
-    mock_pipeline.name = "test-pipeline"
-    engine.load_pipeline.return_value = mock_pipeline
+    engine.load_pipeline.return_value = StubPipeline("test-pipeline")
     
-    # Start the engine
-    await engine.start([temp_config_file])
+    # Start the engine; load_pipeline is mocked, so the file is never read
+    await engine.start(["/nonexistent/config.yaml"])
     
     # Check that the engine is running
     assert engine.running
@@ -126,11 +132,9 @@ async def test_engine_stop():
     engine = Engine()
     engine.running = True
     
-    # Create mock pipelines
-    mock_pipeline1 = AsyncMock()
-    mock_pipeline1.name = "test-pipeline-1"
-    mock_pipeline2 = AsyncMock()
-    mock_pipeline2.name = "test-pipeline-2"
+    # Create stub pipelines
+    mock_pipeline1 = StubPipeline("test-pipeline-1")
+    mock_pipeline2 = StubPipeline("test-pipeline-2")
     
     engine.pipelines = {
         "test-pipeline-1": mock_pipeline1,
@@ -144,8 +148,8 @@ async def test_engine_stop():
     assert not engine.running
     
     # Check that all pipelines were stopped
-    assert mock_pipeline1.stop.called
-    assert mock_pipeline2.stop.called
+    assert mock_pipeline1.stop_called
+    assert mock_pipeline2.stop_called
 
 
 @pytest.mark.asyncio
@@ -163,13 +167,12 @@ async def test_engine_get_pipeline_status():
     mock_pipeline.events_processed = 100
     mock_pipeline.events_dropped = 10
     mock_pipeline.processing_errors = 5
-    mock_pipeline.start_time = 1000
+    mock_pipeline.start_time = time.time() - 100
     
     engine.pipelines["test-pipeline"] = mock_pipeline
     
     # Get the pipeline status
-    with patch("time.time", return_value=1100):
-        status = engine.get_pipeline_status("test-pipeline")
+    status = engine.get_pipeline_status("test-pipeline")
     
     # Check the status
     assert status["name"] == "test-pipeline"
@@ -180,7 +183,7 @@ async def test_engine_get_pipeline_status():
     assert status["events_processed"] == 100
     assert status["events_dropped"] == 10
     assert status["processing_errors"] == 5
-    assert status["uptime"] == 100  # 1100 - 1000
+    assert status["uptime"] == pytest.approx(100, abs=1)
 
 
 def test_engine_get_pipeline_names():
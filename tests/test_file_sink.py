@@ -1,52 +1,58 @@
 """
 Tests for the file sink.
 """
-import os
-import json
-import tempfile
 from datetime import datetime
+from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 from logflow.sinks.file import FileSink
 from logflow.core.models import LogEvent
+from logflow.utils.serialization import loads
+
+
+# Source and timestamps of the test events
+EVENT_SOURCE = {"source_type": "test", "source_name": "test_source"}
+TIMESTAMP1 = datetime(2023, 1, 1, 12, 0, 0)
+TIMESTAMP2 = datetime(2023, 1, 1, 12, 1, 0)
 
 
 @pytest.fixture
-def temp_output_file():
+def temp_output_file(tmp_root, request):
     """Create a temporary output file."""
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        path = f.name
+    return str(tmp_root / f"{request.node.name}.log")
+
+
+@pytest_asyncio.fixture
+async def sink(temp_output_file, request):
+    """Create a file sink writing to the temporary output file."""
+    sink = FileSink()
+    await sink.initialize({"path": temp_output_file, **request.param})
     
-    yield path
+    yield sink
     
-    # Clean up
-    if os.path.exists(path):
-        os.unlink(path)
+    await sink.shutdown()
 
 
 @pytest.mark.asyncio
-async def test_file_sink_initialization():
+async def test_file_sink_initialization(temp_output_file):
     """Test initializing a file sink."""
     sink = FileSink()
     
     # Initialize with a valid configuration
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        try:
-            await sink.initialize({
-                "path": f.name,
-                "format": "json",
-                "append": True
-            })
-            
-            assert sink.path == f.name
-            assert sink.format == "json"
-            assert sink.append is True
-            
-            # Clean up
-            await sink.shutdown()
-        finally:
-            os.unlink(f.name)
+    await sink.initialize({
+        "path": temp_output_file,
+        "format": "json",
+        "append": True
+    })
+    
+    assert sink.path == temp_output_file
+    assert sink.format == "json"
+    assert sink.append is True
+    
+    # Clean up
+    await sink.shutdown()
     
     # Initialize with an invalid configuration (missing path)
     with pytest.raises(ValueError, match="File path is required"):
@@ -61,91 +67,73 @@ async def test_file_sink_initialization():
 
 
 @pytest.mark.asyncio
-async def test_file_sink_write_json(temp_output_file):
+@pytest.mark.parametrize("sink", [{"format": "json", "append": True}], indirect=True)
+async def test_file_sink_write_json(sink, temp_output_file):
     """Test writing events in JSON format."""
-    sink = FileSink()
-    
-    # Initialize with the temporary file
-    await sink.initialize({
-        "path": temp_output_file,
-        "format": "json",
-        "append": True
-    })
-    
     # Create test events
     event1 = LogEvent(
         raw_data="test log message 1",
-        source_type="test",
-        source_name="test_source",
+        **EVENT_SOURCE,
         event_id="test-id-1",
-        timestamp=datetime(2023, 1, 1, 12, 0, 0)
+        timestamp=TIMESTAMP1
     )
     event1.add_field("level", "INFO")
     
     event2 = LogEvent(
         raw_data="test log message 2",
-        source_type="test",
-        source_name="test_source",
+        **EVENT_SOURCE,
         event_id="test-id-2",
-        timestamp=datetime(2023, 1, 1, 12, 1, 0)
+        timestamp=TIMESTAMP2
     )
     event2.add_field("level", "ERROR")
     
     # Write the events
     await sink.write([event1, event2])
     
-    # Close the sink
+    # Close the sink to flush the output
     await sink.shutdown()
     
     # Read the output file
-    with open(temp_output_file, "r") as f:
-        lines = f.readlines()
+    lines = Path(temp_output_file).read_text().splitlines()
     
     # Check the output
     assert len(lines) == 2
     
-    event1_dict = json.loads(lines[0])
+    event1_dict = loads(lines[0])
     assert event1_dict["id"] == "test-id-1"
     assert event1_dict["raw_data"] == "test log message 1"
     assert event1_dict["fields"]["level"] == "INFO"
     
-    event2_dict = json.loads(lines[1])
+    event2_dict = loads(lines[1])
     assert event2_dict["id"] == "test-id-2"
     assert event2_dict["raw_data"] == "test log message 2"
     assert event2_dict["fields"]["level"] == "ERROR"
 
 
 @pytest.mark.asyncio
-async def test_file_sink_write_text(temp_output_file):
+@pytest.mark.parametrize("sink", [{
+    "format": "text",
+    "append": True,
+    "template": "{timestamp} [{level}] {message}",
+    "message_field": "message"
+}], indirect=True)
+async def test_file_sink_write_text(sink, temp_output_file):
     """Test writing events in text format."""
-    sink = FileSink()
-    
-    # Initialize with the temporary file
-    await sink.initialize({
-        "path": temp_output_file,
-        "format": "text",
-        "append": True,
-        "template": "{timestamp} [{level}] {message}",
-        "message_field": "message"
-    })
-    
     # Create test events
     event1 = LogEvent(
         raw_data="raw message 1",
-        source_type="test",
-        source_name="test_source",
+        **EVENT_SOURCE,
         event_id="test-id-1",
-        timestamp=datetime(2023, 1, 1, 12, 0, 0)
+        timestamp=TIMESTAMP1
     )
     event1.add_field("level", "INFO")
     event1.add_field("message", "Formatted message 1")
     
     event2 = LogEvent(
         raw_data="raw message 2",
-        source_type="test",
-        source_name="test_source",
+        **EVENT_SOURCE,
         event_id="test-id-2",
-        timestamp=datetime(2023, 1, 1, 12, 1, 0)
+        timestamp=TIMESTAMP2
     )
     event2.add_field("level", "ERROR")
     event2.add_field("message", "Formatted message 2")
@@ -153,79 +141,77 @@ async def test_file_sink_write_text(temp_output_file):
     # Write the events
     await sink.write([event1, event2])
     
-    # Close the sink
+    # Close the sink to flush the output
     await sink.shutdown()
     
     # Read the output file
-    with open(temp_output_file, "r") as f:
-        lines = f.readlines()
+    lines = Path(temp_output_file).read_text().splitlines()
     
     # Check the output
     assert len(lines) == 2
-    assert lines[0].strip() == "2023-01-01T12:00:00 [INFO] Formatted message 1"
-    assert lines[1].strip() == "2023-01-01T12:01:00 [ERROR] Formatted message 2"
+    assert lines[0] == "2023-01-01T12:00:00 [INFO] Formatted message 1"
+    assert lines[1] == "2023-01-01T12:01:00 [ERROR] Formatted message 2"
 
 
 @pytest.mark.asyncio
-async def test_file_sink_append(temp_output_file):
-    """Test appending to an existing file."""
+@pytest.mark.parametrize("append, message", [
+    (True, "Appended content"),
+    (False, "Overwritten content")
+])
+async def test_file_sink_append(temp_output_file, append, message):
+    """Test appending to or overwriting an existing file."""
     # Write initial content
-    with open(temp_output_file, "w") as f:
-        f.write("Initial content\n")
+    Path(temp_output_file).write_text("Initial content\n")
     
-    # Create and initialize the sink with append=True
-    sink1 = FileSink()
-    await sink1.initialize({
+    # Create and initialize the sink
+    sink = FileSink()
+    await sink.initialize({
         "path": temp_output_file,
         "format": "text",
-        "append": True,
+        "append": append,
         "template": "{message}"
     })
     
     # Write an event
     event = LogEvent(
         raw_data="test message",
-        source_type="test",
-        source_name="test_source"
+        **EVENT_SOURCE
     )
-    event.add_field("message", "Appended content")
+    event.add_field("message", message)
     
-    await sink1.write([event])
-    await sink1.shutdown()
+    await sink.write([event])
+    await sink.shutdown()
     
     # Read the file
-    with open(temp_output_file, "r") as f:
-        content = f.read()
-    
-    # Check that the content was appended
-    assert "Initial content" in content
-    assert "Appended content" in content
+    content = Path(temp_output_file).read_text()
     
-    # Create and initialize the sink with append=False
-    sink2 = FileSink()
-    await sink2.initialize({
-        "path": temp_output_file,
-        "format": "text",
-        "append": False,
-        "template": "{message}"
-    })
-    
-    # Write another event
+    # Check that the content was appended or overwritten
+    assert ("Initial content" in content) is append
+    assert message in content
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sink, expected", [
+    ({"format": "json", "append": True}, None),
+    ({"format": "text", "append": True, "template": "{message}"}, '{"a": 1}')
+], indirect=["sink"])
+async def test_file_sink_write_bytes(sink, temp_output_file, expected):
+    """Test writing events whose raw data was left undecoded by the source."""
+    # Kafka sources with decode_values disabled yield the value bytes
     event = LogEvent(
-        raw_data="test message",
-        source_type="test",
-        source_name="test_source"
+        raw_data=b'{"a": 1}',
+        **EVENT_SOURCE,
+        event_id="test-id-1",
+        timestamp=TIMESTAMP1
     )
-    event.add_field("message", "Overwritten content")
     
-    await sink2.write([event])
-    await sink2.shutdown()
+    await sink.write([event])
+    await sink.shutdown()
     
-    # Read the file
-    with open(temp_output_file, "r") as f:
-        content = f.read()
+    line = Path(temp_output_file).read_text().splitlines()[0]
     
-    # Check that the content was overwritten
-    assert "Initial content" not in content
-    assert "Appended content" not in content
-    assert "Overwritten content" in content
\ No newline at end of file
+    # Check that the raw data was written as text
+    if expected is None:
+        assert loads(line)["raw_data"] == '{"a": 1}'
+    else:
+        assert line == expected
@@ -1,8 +1,6 @@
 """
 Tests for the file source.
 """
-import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -13,18 +11,12 @@ from logflow.core.models import LogEvent
 
 
 @pytest.fixture
-def temp_log_file():
+def temp_log_file(tmp_root, request):
     """Create a temporary log file."""
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as f:
-        f.write("line 1\n")
-        f.write("line 2\n")
-        f.write("line 3\n")
-        path = f.name
+    path = tmp_root / f"{request.node.name}.log"
+    path.write_text("line 1\nline 2\nline 3\n")
     
-    yield path
-    
-    # Clean up
-    os.unlink(path)
+    return str(path)
 
 
 @pytest.mark.asyncio
@@ -83,7 +75,7 @@ async def test_file_source_read(temp_log_file):
 
 
 @pytest.mark.asyncio
-async def test_file_source_tail(temp_log_file):
+async def test_file_source_tail(temp_log_file, monkeypatch):
     """Test tailing a file source."""
     source = FileSource()
     
@@ -95,21 +87,35 @@ async def test_file_source_tail(temp_log_file):
         "poll_interval": 0.1
     })
     
-    # Start reading in a separate task
-    read_task = asyncio.create_task(source.read().__anext__())
+    # Signal when the reader reaches the end of the file and starts polling
+    polling = asyncio.Event()
+    sleep = asyncio.sleep
+    
+    async def poll_sleep(delay, *args, **kwargs):
+        if delay == source.poll_interval:
+            polling.set()
+        return await sleep(delay, *args, **kwargs)
     
-    # Wait a bit for the task to start
-    await asyncio.sleep(0.2)
+    monkeypatch.setattr(asyncio, "sleep", poll_sleep)
     
-    # Append a new line to the file
-    with open(temp_log_file, "a") as f:
-        f.write("line 4\n")
+    # Read the existing lines
+    reader = source.read()
+    for expected in ["line 1", "line 2", "line 3"]:
+        event = await asyncio.wait_for(reader.__anext__(), timeout=1.0)
+        assert event.raw_data == expected
     
-    # Wait for the event
-    event = await asyncio.wait_for(read_task, timeout=1.0)
+    async def append():
+        # Append a new line once the reader is polling the file
+        await polling.wait()
+        with open(temp_log_file, "a") as f:
+            f.write("line 4\n")
     
-    # Check the event
-    assert event.raw_data == "line 1"
+    # The reader picks up the new line when it polls
+    event, _ = await asyncio.wait_for(
+        asyncio.gather(reader.__anext__(), append()), timeout=1.0
+    )
+    assert event.raw_data == "line 4"
     
     # Stop the source
-    await source.shutdown()
\ No newline at end of file
+    await source.shutdown()
+    await reader.aclose()
\ No newline at end of file
@@ -2,9 +2,18 @@
 Tests for the filter processor.
 """
 import pytest
+import pytest_asyncio
 
 from logflow.processors.filter import FilterProcessor
-from logflow.core.models import LogEvent
+
+
+@pytest_asyncio.fixture(scope="module")
+async def processor(request):
+    """Create a filter processor once per module for each configuration."""
+    processor = FilterProcessor()
+    await processor.initialize(request.param)
+    
+    return processor
 
 
 @pytest.mark.asyncio
@@ -45,27 +54,12 @@ async def test_filter_processor_initialization():
 
 
 @pytest.mark.asyncio
-async def test_filter_processor_equals_condition():
+@pytest.mark.parametrize("processor", [{"condition": "level == 'INFO'"}], indirect=True)
+async def test_filter_processor_equals_condition(processor, make_event):
     """Test filtering with equals condition."""
-    processor = FilterProcessor()
-    await processor.initialize({
-        "condition": "level == 'INFO'"
-    })
-    
     # Create test events
-    event1 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event1.add_field("level", "INFO")
-    
-    event2 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event2.add_field("level", "ERROR")
+    event1 = make_event({"level": "INFO"})
+    event2 = make_event({"level": "ERROR"})
     
     # Process the events
     processed_event1 = await processor.process(event1)
@@ -77,27 +71,12 @@ async def test_filter_processor_equals_condition():
 
 
 @pytest.mark.asyncio
-async def test_filter_processor_not_equals_condition():
+@pytest.mark.parametrize("processor", [{"condition": "level != 'DEBUG'"}], indirect=True)
+async def test_filter_processor_not_equals_condition(processor, make_event):
     """Test filtering with not equals condition."""
-    processor = FilterProcessor()
-    await processor.initialize({
-        "condition": "level != 'DEBUG'"
-    })
-    
     # Create test events
-    event1 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event1.add_field("level", "INFO")
-    
-    event2 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event2.add_field("level", "DEBUG")
+    event1 = make_event({"level": "INFO"})
+    event2 = make_event({"level": "DEBUG"})
     
     # Process the events
     processed_event1 = await processor.process(event1)
@@ -109,27 +88,12 @@ async def test_filter_processor_not_equals_condition():
 
 
 @pytest.mark.asyncio
-async def test_filter_processor_comparison_conditions():
+@pytest.mark.parametrize("processor", [{"condition": "status_code < 400"}], indirect=True)
+async def test_filter_processor_comparison_conditions(processor, make_event):
     """Test filtering with comparison conditions."""
-    processor = FilterProcessor()
-    await processor.initialize({
-        "condition": "status_code < 400"
-    })
-    
     # Create test events
-    event1 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event1.add_field("status_code", 200)
-    
-    event2 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event2.add_field("status_code", 500)
+    event1 = make_event({"status_code": 200})
+    event2 = make_event({"status_code": 500})
     
     # Process the events
     processed_event1 = await processor.process(event1)
@@ -141,27 +105,12 @@ async def test_filter_processor_comparison_conditions():
 
 
 @pytest.mark.asyncio
-async def test_filter_processor_regex_conditions():
+@pytest.mark.parametrize("processor", [{"condition": "message =~ 'error|warning'"}], indirect=True)
+async def test_filter_processor_regex_conditions(processor, make_event):
     """Test filtering with regex conditions."""
-    processor = FilterProcessor()
-    await processor.initialize({
-        "condition": "message =~ 'error|warning'"
-    })
-    
     # Create test events
-    event1 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event1.add_field("message", "This is an error message")
-    
-    event2 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event2.add_field("message", "This is a success message")
+    event1 = make_event({"message": "This is an error message"})
+    event2 = make_event({"message": "This is a success message"})
     
     # Process the events
     processed_event1 = await processor.process(event1)
@@ -173,27 +122,12 @@ async def test_filter_processor_regex_conditions():
 
 
 @pytest.mark.asyncio
-async def test_filter_processor_in_conditions():
+@pytest.mark.parametrize("processor", [{"condition": "level in [INFO, WARN, ERROR]"}], indirect=True)
+async def test_filter_processor_in_conditions(processor, make_event):
     """Test filtering with in conditions."""
-    processor = FilterProcessor()
-    await processor.initialize({
-        "condition": "level in [INFO, WARN, ERROR]"
-    })
-    
     # Create test events
-    event1 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event1.add_field("level", "INFO")
-    
-    event2 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event2.add_field("level", "DEBUG")
+    event1 = make_event({"level": "INFO"})
+    event2 = make_event({"level": "DEBUG"})
     
     # Process the events
     processed_event1 = await processor.process(event1)
@@ -205,26 +139,12 @@ async def test_filter_processor_in_conditions():
 
 
 @pytest.mark.asyncio
-async def test_filter_processor_exists_conditions():
+@pytest.mark.parametrize("processor", [{"condition": "exists:error_code"}], indirect=True)
+async def test_filter_processor_exists_conditions(processor, make_event):
     """Test filtering with exists conditions."""
-    processor = FilterProcessor()
-    await processor.initialize({
-        "condition": "exists:error_code"
-    })
-    
     # Create test events
-    event1 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event1.add_field("error_code", 500)
-    
-    event2 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
+    event1 = make_event({"error_code": 500})
+    event2 = make_event()
     
     # Process the events
     processed_event1 = await processor.process(event1)
@@ -236,100 +156,40 @@ async def test_filter_processor_exists_conditions():
 
 
 @pytest.mark.asyncio
-async def test_filter_processor_multiple_conditions():
+@pytest.mark.parametrize("processor, expected", [
+    # Events pass if they match any condition
+    (
+        {"conditions": ["level == 'ERROR'", "message =~ '(?i)critical'"], "mode": "any"},
+        [True, True, False, True]
+    ),
+    # Events pass only if they match all conditions
+    (
+        {"conditions": ["level == 'ERROR'", "message =~ '(?i)critical'"], "mode": "all"},
+        [False, False, False, True]
+    )
+], indirect=["processor"])
+async def test_filter_processor_multiple_conditions(processor, expected, make_event):
     """Test filtering with multiple conditions."""
-    # Test with mode=any
-    processor1 = FilterProcessor()
-    await processor1.initialize({
-        "conditions": ["level == 'ERROR'", "message =~ 'critical'"],
-        "mode": "any"
-    })
-    
     # Create test events
-    event1 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event1.add_field("level", "ERROR")
-    event1.add_field("message", "Normal message")
-    
-    event2 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event2.add_field("level", "INFO")
-    event2.add_field("message", "Critical issue detected")
-    
-    event3 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event3.add_field("level", "INFO")
-    event3.add_field("message", "Normal message")
-    
-    # Process the events
-    processed_event1 = await processor1.process(event1)
-    processed_event2 = await processor1.process(event2)
-    processed_event3 = await processor1.process(event3)
-    
-    # Check the results
-    assert processed_event1 is not None  # Passes due to level=ERROR
-    assert processed_event2 is not None  # Passes due to message containing 'critical'
-    assert processed_event3 is None  # Doesn't match any condition
-    
-    # Test with mode=all
-    processor2 = FilterProcessor()
-    await processor2.initialize({
-        "conditions": ["level == 'ERROR'", "message =~ 'critical'"],
-        "mode": "all"
-    })
+    events = [
+        make_event({"level": "ERROR", "message": "Normal message"}),
+        make_event({"level": "INFO", "message": "Critical issue detected"}),
+        make_event({"level": "INFO", "message": "Normal message"}),
+        make_event({"level": "ERROR", "message": "Critical issue detected"})
+    ]
     
-    # Create a test event that matches both conditions
-    event4 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event4.add_field("level", "ERROR")
-    event4.add_field("message", "Critical issue detected")
-    
-    # Process the events
-    processed_event1 = await processor2.process(event1)
-    processed_event2 = await processor2.process(event2)
-    processed_event4 = await processor2.process(event4)
-    
-    # Check the results
-    assert processed_event1 is None  # Doesn't match all conditions
-    assert processed_event2 is None  # Doesn't match all conditions
-    assert processed_event4 is not None  # Matches all conditions
+    # Process the events and check which ones passed
+    passed = [await processor.process(event) is not None for event in events]
+    assert passed == expected
 
 
 @pytest.mark.asyncio
-async def test_filter_processor_negation():
+@pytest.mark.parametrize("processor", [{"condition": "level == 'ERROR'", "negate": True}], indirect=True)
+async def test_filter_processor_negation(processor, make_event):
     """Test filtering with negation."""
-    processor = FilterProcessor()
-    await processor.initialize({
-        "condition": "level == 'ERROR'",
-        "negate": True
-    })
-    
     # Create test events
-    event1 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event1.add_field("level", "ERROR")
-    
-    event2 = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    event2.add_field("level", "INFO")
+    event1 = make_event({"level": "ERROR"})
+    event2 = make_event({"level": "INFO"})
     
     # Process the events
     processed_event1 = await processor.process(event1)
@@ -337,4 +197,16 @@ async def test_filter_processor_negation():
     
     # Check the results
     assert processed_event1 is None  # Event with level=ERROR is dropped due to negation
-    assert processed_event2 is not None  # Event with level=INFO passes due to negation
\ No newline at end of file
+    assert processed_event2 is not None  # Event with level=INFO passes due to negation
+
+
+@pytest.mark.asyncio
+async def test_filter_processor_shares_parsed_conditions():
+    """Test that processors with the same condition share the parsed condition."""
+    processor1 = FilterProcessor()
+    await processor1.initialize({"condition": "message =~ 'error|warning'"})
+    
+    processor2 = FilterProcessor()
+    await processor2.initialize({"condition": "message =~ 'error|warning'"})
+    
+    assert processor1.conditions[0] is processor2.conditions[0]
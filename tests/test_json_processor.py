@@ -117,41 +117,24 @@ async def test_json_processor_process_no_target_field():
 
 
 @pytest.mark.asyncio
-async def test_json_processor_process_invalid_json():
+@pytest.mark.parametrize("ignore_errors, dropped", [(False, True), (True, False)])
+async def test_json_processor_process_invalid_json(ignore_errors, dropped):
     """Test processing invalid JSON."""
-    # Test with ignore_errors=False
-    processor1 = JsonProcessor()
-    await processor1.initialize({
-        "ignore_errors": False
-    })
-    
-    event1 = LogEvent(
-        raw_data='{"invalid": "json"',  # Missing closing brace
-        source_type="test",
-        source_name="test_source"
-    )
-    
-    # Process the event
-    processed_event1 = await processor1.process(event1)
-    
-    # Check that the event was dropped
-    assert processed_event1 is None
-    
-    # Test with ignore_errors=True
-    processor2 = JsonProcessor()
-    await processor2.initialize({
-        "ignore_errors": True
+    processor = JsonProcessor()
+    await processor.initialize({
+        "ignore_errors": ignore_errors
     })
     
-    event2 = LogEvent(
+    event = LogEvent(
         raw_data='{"invalid": "json"',  # Missing closing brace
         source_type="test",
         source_name="test_source"
     )
     
     # Process the event
-    processed_event2 = await processor2.process(event2)
+    processed_event = await processor.process(event)
     
-    # Check that the event was not dropped
-    assert processed_event2 is not None
-    assert "json_error" in processed_event2.metadata
\ No newline at end of file
+    # Check that the event was dropped, or kept with the error recorded
+    assert (processed_event is None) is dropped
+    if not dropped:
+        assert "json_error" in processed_event.metadata
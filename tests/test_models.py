@@ -6,7 +6,11 @@ from datetime import datetime
 
 import pytest
 
-from logflow.core.models import LogEvent
+from logflow.core.models import LogEvent, datetime_to_ns, fast_isoformat
+
+
+# Fixed timestamp, with microseconds to cover the fractional part
+FIXED_TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0, 123456)
 
 
 def test_log_event_creation():
@@ -27,63 +31,38 @@ def test_log_event_creation():
     assert event.tags == []
 
 
-def test_log_event_add_field():
-    """Test adding fields to a LogEvent."""
-    event = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    
-    event.add_field("level", "INFO")
-    event.add_field("message", "This is a test")
-    
-    assert event.fields["level"] == "INFO"
-    assert event.fields["message"] == "This is a test"
-
-
-def test_log_event_add_metadata():
-    """Test adding metadata to a LogEvent."""
-    event = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
-    )
-    
-    event.add_metadata("processed_by", "test_processor")
-    event.add_metadata("processing_time", 0.5)
-    
-    assert event.metadata["processed_by"] == "test_processor"
-    assert event.metadata["processing_time"] == 0.5
-
-
-def test_log_event_add_tag():
-    """Test adding tags to a LogEvent."""
-    event = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source"
+@pytest.mark.parametrize("method, attribute, calls, expected", [
+    (
+        "add_field", "fields",
+        [("level", "INFO"), ("message", "This is a test")],
+        {"level": "INFO", "message": "This is a test"}
+    ),
+    (
+        "add_metadata", "metadata",
+        [("processed_by", "test_processor"), ("processing_time", 0.5)],
+        {"processed_by": "test_processor", "processing_time": 0.5}
+    ),
+    # Adding the same tag twice should not duplicate it
+    (
+        "add_tag", "tags",
+        [("test",), ("example",), ("test",)],
+        ["test", "example"]
     )
+])
+def test_log_event_add(make_event, method, attribute, calls, expected):
+    """Test adding fields, metadata and tags to a LogEvent."""
+    event = make_event()
     
-    event.add_tag("test")
-    event.add_tag("example")
+    add = getattr(event, method)
+    for args in calls:
+        add(*args)
     
-    assert "test" in event.tags
-    assert "example" in event.tags
-    
-    # Adding the same tag twice should not duplicate it
-    event.add_tag("test")
-    assert len(event.tags) == 2
+    assert getattr(event, attribute) == expected
 
 
-def test_log_event_to_dict():
+def test_log_event_to_dict(make_event):
     """Test converting a LogEvent to a dictionary."""
-    event = LogEvent(
-        raw_data="test log message",
-        source_type="test",
-        source_name="test_source",
-        event_id="test-id"
-    )
+    event = make_event(event_id="test-id")
     
     event.add_field("level", "INFO")
     event.add_metadata("processed_by", "test_processor")
@@ -102,7 +81,7 @@ def test_log_event_to_dict():
 
 def test_log_event_from_dict():
     """Test creating a LogEvent from a dictionary."""
-    timestamp = datetime.utcnow()
+    timestamp = FIXED_TIMESTAMP
     
     event_dict = {
         "id": "test-id",
@@ -124,4 +103,26 @@ def test_log_event_from_dict():
     assert event.fields["level"] == "INFO"
     assert event.metadata["processed_by"] == "test_processor"
     assert "test" in event.tags
-    assert event.timestamp.isoformat() == timestamp.isoformat()
\ No newline at end of file
+    assert event.timestamp.isoformat() == timestamp.isoformat()
+
+
+def test_log_event_timestamp_ns(make_event):
+    """Test that LogEvent timestamps are tracked in nanoseconds."""
+    timestamp = datetime(2023, 1, 1, 12, 0, 0, 123456)
+    
+    event = make_event(timestamp=timestamp)
+    
+    assert event.timestamp == timestamp
+    assert event.timestamp_ns == datetime_to_ns(timestamp)
+    assert event.isoformat() == timestamp.isoformat()
+
+
+def test_fast_isoformat():
+    """Test that fast_isoformat matches datetime.isoformat."""
+    for timestamp in [
+        datetime(2023, 1, 1, 12, 0, 0),
+        datetime(2023, 1, 1, 12, 0, 0, 1),
+        datetime(2023, 1, 1, 12, 0, 0, 500000),
+        datetime(1999, 12, 31, 23, 59, 59, 999999),
+    ]:
+        assert fast_isoformat(datetime_to_ns(timestamp)) == timestamp.isoformat()
@@ -2,80 +2,50 @@
 Tests for the pipeline.
 """
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
 
 import pytest
 
 from logflow.core.pipeline import Pipeline
 from logflow.core.models import LogEvent
-from logflow.sources.base import Source
-from logflow.processors.base import Processor
-from logflow.sinks.base import Sink
-
-
-class MockSource(Source):
-    """Mock source for testing."""
-    
-    def __init__(self):
-        self.initialize_called = False
-        self.shutdown_called = False
-        self.events = []
-    
-    async def initialize(self, config):
-        self.initialize_called = True
-        self.config = config
-    
-    async def read(self):
-        for event in self.events:
-            yield event
-    
-    async def shutdown(self):
-        self.shutdown_called = True
-
-
-class MockProcessor(Processor):
-    """Mock processor for testing."""
-    
-    def __init__(self):
-        self.initialize_called = False
-        self.shutdown_called = False
-        self.processed_events = []
-        self.drop_events = False
-    
-    async def initialize(self, config):
-        self.initialize_called = True
-        self.config = config
-    
-    async def process(self, event):
-        self.processed_events.append(event)
-        if self.drop_events:
-            return None
-        return event
-    
-    async def shutdown(self):
-        self.shutdown_called = True
-
-
-class MockSink(Sink):
-    """Mock sink for testing."""
-    
-    def __init__(self):
-        self.initialize_called = False
-        self.shutdown_called = False
-        self.written_events = []
-    
-    async def initialize(self, config):
-        self.initialize_called = True
-        self.config = config
-    
-    async def write(self, events):
-        self.written_events.extend(events)
-    
-    async def shutdown(self):
-        self.shutdown_called = True
-
-
-@pytest.fixture
+from logflow.sources.winlog import WinlogSource
+from tests.mocks import EndlessSource, MockProcessor, MockSink, MockSource
+
+
+# Configuration of the pipeline initialization test
+INIT_CONFIG = {
+    "sources": [
+        {
+            "name": "test-source",
+            "type": "MockSource",
+            "config": {"test": "source-config"}
+        }
+    ],
+    "processors": [
+        {
+            "name": "test-processor",
+            "type": "MockProcessor",
+            "config": {"test": "processor-config"}
+        }
+    ],
+    "sinks": [
+        {
+            "name": "test-sink",
+            "type": "MockSink",
+            "config": {"test": "sink-config"}
+        }
+    ]
+}
+
+# Configuration of the pipeline run tests; the batch fills with the two test
+# events, so it is flushed without waiting for the batch timeout
+RUN_CONFIG = {
+    "batch_size": 2,
+    "batch_timeout": 0.001
+}
+
+
+@pytest.fixture(scope="module")
 def mock_components():
     """Create mock components for testing."""
     source = MockSource()
@@ -85,48 +55,60 @@ def mock_components():
     return source, processor, sink
 
 
+@pytest.fixture
+def events(next_id):
+    """Create test events."""
+    return [
+        LogEvent(
+            raw_data=f"test log message {i}",
+            source_type="test",
+            source_name="test_source",
+            event_id=next_id()
+        )
+        for i in (1, 2)
+    ]
+
+
+def make_pipeline(source, processor, sink, config=RUN_CONFIG):
+    """Create a pipeline wired to the given components."""
+    pipeline = Pipeline("test-pipeline", config)
+    pipeline.sources = [source]
+    pipeline.processors = [processor]
+    pipeline.sinks = [sink]
+    
+    return pipeline
+
+
+@pytest.fixture(autouse=True)
+def reset_components(mock_components):
+    """Reset the shared mock components before each test."""
+    for component in mock_components:
+        component.reset()
+
+
 @pytest.mark.asyncio
 async def test_pipeline_initialization(mock_components):
     """Test initializing a pipeline."""
     source, processor, sink = mock_components
     
-    # Create a pipeline configuration
-    config = {
-        "sources": [
-            {
-                "name": "test-source",
-                "type": "MockSource",
-                "config": {"test": "source-config"}
-            }
-        ],
-        "processors": [
-            {
-                "name": "test-processor",
-                "type": "MockProcessor",
-                "config": {"test": "processor-config"}
-            }
-        ],
-        "sinks": [
-            {
-                "name": "test-sink",
-                "type": "MockSink",
-                "config": {"test": "sink-config"}
-            }
-        ]
-    }
-    
     # Create a pipeline
-    pipeline = Pipeline("test-pipeline", config)
+    pipeline = Pipeline("test-pipeline", INIT_CONFIG)
     
-    # Mock the _create_component method to return our mock components
-    pipeline._create_component = MagicMock()
-    pipeline._create_component.side_effect = [source, processor, sink]
+    # Replace the _create_component method to return our mock components
+    components = iter([source, processor, sink])
+    calls = []
+    
+    def create_component(**kwargs):
+        calls.append(kwargs)
+        return next(components)
+    
+    pipeline._create_component = create_component
     
     # Initialize the pipeline
     await pipeline.initialize()
     
     # Check that the components were created and initialized
-    assert pipeline._create_component.call_count == 3
+    assert [call["component_type"] for call in calls] == ["source", "processor", "sink"]
     assert source.initialize_called
     assert processor.initialize_called
     assert sink.initialize_called
@@ -136,112 +118,33 @@ async def test_pipeline_initialization(mock_components):
 
 
 @pytest.mark.asyncio
-async def test_pipeline_processing(mock_components):
-    """Test processing events through a pipeline."""
+@pytest.mark.parametrize("drop_events, written, processed, dropped", [
+    (False, 2, 2, 0),
+    (True, 0, 0, 2)
+])
+async def test_pipeline_run(mock_components, events, drop_events, written, processed, dropped):
+    """Test processing and dropping events in a pipeline."""
     source, processor, sink = mock_components
     
-    # Create test events
-    event1 = LogEvent(
-        raw_data="test log message 1",
-        source_type="test",
-        source_name="test_source"
-    )
-    event2 = LogEvent(
-        raw_data="test log message 2",
-        source_type="test",
-        source_name="test_source"
-    )
-    
-    source.events = [event1, event2]
+    # Configure the processor to keep or drop events
+    processor.drop_events = drop_events
+    source.events = events
     
-    # Create a pipeline configuration
-    config = {
-        "batch_size": 10,
-        "batch_timeout": 0.1
-    }
-    
-    # Create a pipeline
-    pipeline = Pipeline("test-pipeline", config)
-    pipeline.sources = [source]
-    pipeline.processors = [processor]
-    pipeline.sinks = [sink]
+    pipeline = make_pipeline(source, processor, sink)
     
-    # Run the pipeline for a short time
-    pipeline.running = True
-    run_task = asyncio.create_task(pipeline.run())
-    
-    # Wait for the pipeline to process the events
-    await asyncio.sleep(0.2)
-    
-    # Stop the pipeline
-    pipeline.running = False
-    await run_task
-    
-    # Check that the events were processed
-    assert len(processor.processed_events) == 2
-    assert processor.processed_events[0] == event1
-    assert processor.processed_events[1] == event2
-    
-    # Check that the events were written to the sink
-    assert len(sink.written_events) == 2
-    assert sink.written_events[0] == event1
-    assert sink.written_events[1] == event2
-
-
-@pytest.mark.asyncio
-async def test_pipeline_event_dropping(mock_components):
-    """Test dropping events in a pipeline."""
-    source, processor, sink = mock_components
-    
-    # Configure the processor to drop events
-    processor.drop_events = True
-    
-    # Create test events
-    event1 = LogEvent(
-        raw_data="test log message 1",
-        source_type="test",
-        source_name="test_source"
-    )
-    event2 = LogEvent(
-        raw_data="test log message 2",
-        source_type="test",
-        source_name="test_source"
-    )
-    
-    source.events = [event1, event2]
-    
-    # Create a pipeline configuration
-    config = {
-        "batch_size": 10,
-        "batch_timeout": 0.1
-    }
-    
-    # Create a pipeline
-    pipeline = Pipeline("test-pipeline", config)
-    pipeline.sources = [source]
-    pipeline.processors = [processor]
-    pipeline.sinks = [sink]
-    
-    # Run the pipeline for a short time
-    pipeline.running = True
-    run_task = asyncio.create_task(pipeline.run())
-    
-    # Wait for the pipeline to process the events
-    await asyncio.sleep(0.2)
-    
-    # Stop the pipeline
-    pipeline.running = False
-    await run_task
+    # Run the pipeline; it stops once the source is exhausted and the
+    # events were flushed to the sink
+    await asyncio.wait_for(pipeline.run(), timeout=2.0)
     
     # Check that the events were processed
-    assert len(processor.processed_events) == 2
+    assert processor.processed_events == events
     
-    # Check that no events were written to the sink
-    assert len(sink.written_events) == 0
+    # Check which events were written to the sink
+    assert sink.written_events == events[:written]
     
     # Check the pipeline statistics
-    assert pipeline.events_processed == 0
-    assert pipeline.events_dropped == 2
+    assert pipeline.events_processed == processed
+    assert pipeline.events_dropped == dropped
 
 
 @pytest.mark.asyncio
@@ -263,4 +166,72 @@ async def test_pipeline_shutdown(mock_components):
     assert source.shutdown_called
     assert processor.shutdown_called
     assert sink.shutdown_called
-    assert not pipeline.running
\ No newline at end of file
+    assert not pipeline.running
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stop_waits_for_sources(mock_components, events):
+    """Test that stopping a running pipeline waits for its source tasks."""
+    _, processor, sink = mock_components
+    source = EndlessSource(events)
+    
+    pipeline = make_pipeline(source, processor, sink)
+    
+    async def stop():
+        # Let the pipeline create its source tasks, then stop it; the
+        # source tasks are finished when stop() returns
+        await asyncio.sleep(0)
+        tasks = list(pipeline._tasks)
+        assert tasks
+        
+        await pipeline.stop()
+        assert all(task.done() for task in tasks)
+    
+    # Run and stop the pipeline together
+    await asyncio.wait_for(asyncio.gather(pipeline.run(), stop()), timeout=2.0)
+    
+    # The source is only shut down once its task has stopped reading
+    assert source.shutdown_called
+    assert not source.shutdown_while_reading
+    assert sink.shutdown_called
+    assert not pipeline._tasks
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stop_flushes_polling_source(mock_components, tmp_root, request):
+    """Test that stopping a pipeline wakes a polling source and writes its events."""
+    _, processor, sink = mock_components
+    
+    path = tmp_root / f"{request.node.name}.json"
+    path.write_text("".join(
+        json.dumps({"message": f"event {i}", "winlog": {"channel": "Application"}}) + "\n"
+        for i in range(3)
+    ))
+    
+    # Tail the file with the default poll interval of 10 seconds
+    source = WinlogSource()
+    await source.initialize({"mode": "file", "path": str(path), "tail": True})
+    
+    # Signal when the source has read the file and starts polling
+    polling = asyncio.Event()
+    sleep = source._sleep
+    
+    async def poll_sleep(delay):
+        polling.set()
+        await sleep(delay)
+    
+    source._sleep = poll_sleep
+    
+    # Hold the events in a partial batch well past the stop
+    pipeline = make_pipeline(source, processor, sink, {"batch_size": 100, "batch_timeout": 10.0})
+    
+    async def stop():
+        await polling.wait()
+        await pipeline.stop()
+    
+    # The stop must not wait for the poll interval, batch timeout or stop timeout
+    await asyncio.wait_for(asyncio.gather(pipeline.run(), stop()), timeout=2.0)
+    
+    assert [event.fields["message"] for event in sink.written_events] == [
+        "event 0", "event 1", "event 2"
+    ]
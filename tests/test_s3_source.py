@@ -0,0 +1,51 @@
+"""
+Tests for the S3 source.
+"""
+import pytest
+
+from logflow.sources.s3 import S3Source
+
+
+def make_source(**attrs):
+    """Create an S3 source with the given attributes."""
+    source = S3Source()
+    for name, value in attrs.items():
+        setattr(source, name, value)
+    
+    return source
+
+
+def test_s3_source_advance_marker():
+    """Test moving the listing marker past the processed keys."""
+    source = make_source(start_after=True)
+    for key in ["a", "b", "d"]:
+        source._mark_processed(key)
+    
+    # The marker stops before the unprocessed key "c"
+    source._advance_marker(["a", "b", "c", "d"])
+    
+    assert source._marker == "b"
+    assert list(source.processed_keys) == ["d"]
+    
+    # Once "c" is processed, the marker moves past "d" too
+    source._mark_processed("c")
+    source._advance_marker(["c", "d"])
+    
+    assert source._marker == "d"
+    assert not source.processed_keys
+
+
+@pytest.mark.parametrize("start_after, marker, expected", [
+    # Without start_after every key is remembered
+    (False, "", ["a", "b", "c", "d"]),
+    # With start_after only keys at or before the marker are evicted
+    (True, "a", ["b", "c", "d"]),
+    (True, "d", ["c", "d"]),
+])
+def test_s3_source_processed_keys_eviction(start_after, marker, expected):
+    """Test evicting processed keys beyond max_processed_keys."""
+    source = make_source(start_after=start_after, max_processed_keys=2, _marker=marker)
+    for key in ["a", "b", "c", "d"]:
+        source._mark_processed(key)
+    
+    assert list(source.processed_keys) == expected
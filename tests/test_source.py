@@ -0,0 +1,54 @@
+"""
+Tests for the source base class.
+"""
+import pytest
+
+from logflow.core.models import LogEvent
+from tests.mocks import MockSource
+
+
+@pytest.mark.asyncio
+async def test_source_batched(next_id):
+    """Test reading events from a source in batches."""
+    source = MockSource()
+    
+    source.events = [
+        LogEvent(
+            raw_data=f"test log message {i}",
+            source_type="test",
+            source_name="test_source",
+            event_id=next_id()
+        )
+        for i in range(5)
+    ]
+    
+    # Read the events in batches of two
+    batches = [batch async for batch in source.batched(size=2, interval=0.1)]
+    
+    # Check that the last partial batch was also yielded
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [event for batch in batches for event in batch] == source.events
+
+
+@pytest.mark.asyncio
+async def test_source_batched_lists(next_id):
+    """Test batching a source that yields lists of events."""
+    source = MockSource()
+    
+    events = [
+        LogEvent(
+            raw_data=f"test log message {i}",
+            source_type="test",
+            source_name="test_source",
+            event_id=next_id()
+        )
+        for i in range(6)
+    ]
+    source.events = [events[:3], events[3], events[4:]]
+    
+    # Read the events in batches of two
+    batches = [batch async for batch in source.batched(size=2, interval=0.1)]
+    
+    # Check that the lists were merged and split into full batches
+    assert [len(batch) for batch in batches] == [2, 2, 2]
+    assert [event for batch in batches for event in batch] == events